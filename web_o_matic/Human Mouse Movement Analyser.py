@@ -2,19 +2,100 @@
 """
 Human Mouse Movement Analyzer
 Records real human mouse movements to understand natural patterns
+
+Recordings are saved as .npy files holding packed (t float32, x int16, y int16) samples,
+8 bytes each and memory-mapped on load. Convert old JSON recordings with:
+    python "Human Mouse Movement Analyser.py" --convert mouse_movement_*.json
+Analyse a saved recording (.npy or .json):
+    python "Human Mouse Movement Analyser.py" mouse_movement_20250628_161452.npy
 """
 
-import pyautogui
+import os
 import time
 import json
+import argparse
 import threading
 from datetime import datetime
+from lazy_import import lazy_import
+
+pyautogui = lazy_import("pyautogui")
+np = lazy_import("numpy")
+
+# One recorded sample: seconds since the recording started, screen position
+MOVEMENT_DTYPE = [("t", "f8"), ("x", "i4"), ("y", "i4")]
+
+# On-disk sample: float32 seconds (0.25ms resolution an hour in), int16 pixels - 8 bytes
+RECORDING_DTYPE = [("t", "<f4"), ("x", "<i2"), ("y", "<i2")]
+RECORDING_EXTENSION = ".npy"
+
+def movements_to_array(movements):
+    """List of {"timestamp", "x", "y"} dicts -> structured (t, x, y) array"""
+    return np.array([(m["timestamp"], m["x"], m["y"]) for m in movements], dtype=MOVEMENT_DTYPE)
+
+def save_recording(track, path):
+    """Write a track as a compact .npy recording (a ~128 byte header, then the packed samples)"""
+    np.save(path, track.astype(RECORDING_DTYPE))
+
+def load_recording(path):
+    """Read a recording: .npy files are memory-mapped, old .json files are parsed"""
+    if path.endswith(".json"):
+        with open(path, 'r') as f:
+            return movements_to_array(json.load(f)["movements"])
+    return np.load(path, mmap_mode="r")
+
+def convert_recording(json_path, out_path=None):
+    """Convert a mouse_movement_*.json recording to the compact format; returns the new path"""
+    out_path = out_path or os.path.splitext(json_path)[0] + RECORDING_EXTENSION
+    save_recording(load_recording(json_path), out_path)
+    before, after = os.path.getsize(json_path), os.path.getsize(out_path)
+    print(f"🗜️ {json_path} → {out_path} ({before / 1024:.1f} KB → {after / 1024:.1f} KB, {before / after:.0f}x smaller)")
+    return out_path
+
+def compute_kinematics(track):
+    """Velocity, acceleration, jerk and settled/moving phases of a (t, x, y) track in one vectorised pass
+    
+    Steps with no time between samples are skipped, as the analysis always did. Returns
+    arrays in pixels/sec, pixels/sec² and pixels/sec³; "times" holds the timestamp of
+    each velocity sample.
+    """
+    # Widen compact (float32/int16) recordings so large jumps and long captures stay exact
+    t = track["t"].astype(np.float64)
+    dt = np.diff(t)
+    distance = np.hypot(np.diff(track["x"].astype(np.int32)), np.diff(track["y"].astype(np.int32)))
+    valid = dt > 0
+    dt = dt[valid]
+    times = t[1:][valid]
+    
+    velocities = distance[valid] / dt
+    accelerations = np.diff(velocities) / dt[1:]
+    jerks = np.diff(accelerations) / dt[2:]
+    
+    # Phases: below 30% of the average velocity counts as "settled"
+    phases = []
+    if velocities.size:
+        moving = velocities > velocities.mean() * 0.3
+        starts = np.flatnonzero(np.r_[True, moving[1:] != moving[:-1]])
+        phases = [("moving" if moving[i] else "settled", float(times[i])) for i in starts]
+    
+    return {
+        "times": times,
+        "velocities": velocities,
+        "accelerations": accelerations,
+        "jerks": jerks,
+        "phases": phases
+    }
 
 class MouseMovementAnalyzer:
     def __init__(self):
         self.recording = False
-        self.movements = []
+        self.track = np.zeros(0, dtype=MOVEMENT_DTYPE)
         self.start_time = None
+    
+    def load_recording(self, path):
+        """Load a saved mouse_movement_* recording (.npy memory-mapped, or legacy .json)"""
+        self.track = load_recording(path)
+        print(f"📂 Loaded {len(self.track)} points from {path}")
+        return self.track
         
     def start_recording(self, duration=10):
         """Record mouse movements for specified duration"""
@@ -29,7 +110,7 @@ class MouseMovementAnalyzer:
         print("🔴 RECORDING NOW! Move naturally to Gmail and click!")
         
         self.recording = True
-        self.movements = []
+        samples = []
         self.start_time = time.time()
         
         # Record movements
@@ -37,24 +118,17 @@ class MouseMovementAnalyzer:
         while time.time() < end_time and self.recording:
             current_time = time.time()
             x, y = pyautogui.position()
-            
-            movement_data = {
-                "timestamp": current_time - self.start_time,
-                "x": x,
-                "y": y,
-                "relative_time": current_time - self.start_time
-            }
-            
-            self.movements.append(movement_data)
+            samples.append((current_time - self.start_time, x, y))
             time.sleep(0.01)  # 100Hz sampling rate
         
         self.recording = False
+        self.track = np.array(samples, dtype=MOVEMENT_DTYPE)
         print("🛑 Recording stopped!")
-        return self.movements
+        return self.track
     
-    def analyze_movements(self):
-        """Analyze recorded movement patterns"""
-        if not self.movements:
+    def analyze_movements(self, save=True):
+        """Analyze recorded movement patterns; returns the derived series from compute_kinematics()"""
+        if not len(self.track):
             print("❌ No movements recorded")
             return
         
@@ -62,105 +136,54 @@ class MouseMovementAnalyzer:
         print("=" * 50)
         
         # Basic stats
-        total_points = len(self.movements)
-        duration = self.movements[-1]["timestamp"]
+        total_points = len(self.track)
+        duration = float(self.track["t"][-1])
         
         print(f"📈 Total data points: {total_points}")
         print(f"⏱️  Total duration: {duration:.2f} seconds")
         print(f"📊 Sample rate: {total_points/duration:.1f} Hz")
         
-        # Calculate velocities and accelerations
-        velocities = []
-        accelerations = []
+        # Calculate velocities, accelerations and jerk
+        kinematics = compute_kinematics(self.track)
+        velocities = kinematics["velocities"]
         
-        for i in range(1, len(self.movements)):
-            prev = self.movements[i-1]
-            curr = self.movements[i]
-            
-            dt = curr["timestamp"] - prev["timestamp"]
-            if dt > 0:
-                dx = curr["x"] - prev["x"]
-                dy = curr["y"] - prev["y"]
-                distance = (dx**2 + dy**2)**0.5
-                velocity = distance / dt
-                velocities.append(velocity)
-                
-                if len(velocities) > 1:
-                    dv = velocities[-1] - velocities[-2]
-                    acceleration = dv / dt
-                    accelerations.append(acceleration)
-        
-        if velocities:
-            avg_velocity = sum(velocities) / len(velocities)
-            max_velocity = max(velocities)
+        if velocities.size:
+            avg_velocity = float(velocities.mean())
+            max_velocity = float(velocities.max())
             print(f"🚀 Average velocity: {avg_velocity:.1f} pixels/sec")
             print(f"⚡ Peak velocity: {max_velocity:.1f} pixels/sec")
         
         # Movement phases analysis
-        self.analyze_movement_phases()
-        
-        # Save data for later analysis
-        filename = f"mouse_movement_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w') as f:
-            json.dump({
-                "movements": self.movements,
-                "analysis": {
-                    "total_points": total_points,
-                    "duration": duration,
-                    "avg_velocity": avg_velocity if velocities else 0,
-                    "max_velocity": max_velocity if velocities else 0
-                }
-            }, f, indent=2)
+        self.analyze_movement_phases(kinematics)
+        
+        if not save:
+            return kinematics
+        
+        # Save data for later analysis (the summary above is recomputed on load)
+        filename = f"mouse_movement_{datetime.now().strftime('%Y%m%d_%H%M%S')}{RECORDING_EXTENSION}"
+        save_recording(self.track, filename)
         
         print(f"💾 Data saved to: {filename}")
+        return kinematics
         
-    def analyze_movement_phases(self):
+    def analyze_movement_phases(self, kinematics=None):
         """Identify different phases of movement"""
-        if len(self.movements) < 10:
+        if len(self.track) < 10:
             return
             
         print("\n🎯 MOVEMENT PHASES")
         print("-" * 30)
         
-        # Find periods of rapid movement vs settling
-        velocities = []
-        for i in range(1, len(self.movements)):
-            prev = self.movements[i-1]
-            curr = self.movements[i]
-            dt = curr["timestamp"] - prev["timestamp"]
-            if dt > 0:
-                dx = curr["x"] - prev["x"]
-                dy = curr["y"] - prev["y"]
-                distance = (dx**2 + dy**2)**0.5
-                velocity = distance / dt
-                velocities.append((curr["timestamp"], velocity))
-        
-        if not velocities:
-            return
-            
-        # Find movement phases
-        avg_velocity = sum(v[1] for v in velocities) / len(velocities)
-        threshold = avg_velocity * 0.3  # 30% of average = "settled"
-        
-        phases = []
-        current_phase = None
-        
-        for timestamp, velocity in velocities:
-            if velocity > threshold:
-                if current_phase != "moving":
-                    phases.append(("moving", timestamp))
-                    current_phase = "moving"
-            else:
-                if current_phase != "settled":
-                    phases.append(("settled", timestamp))
-                    current_phase = "settled"
+        # Periods of rapid movement vs settling
+        if kinematics is None:
+            kinematics = compute_kinematics(self.track)
         
-        for phase_type, timestamp in phases[:10]:  # Show first 10 phases
+        for phase_type, timestamp in kinematics["phases"][:10]:  # Show first 10 phases
             print(f"   {timestamp:.2f}s: {phase_type}")
             
     def generate_human_movement_function(self, target_x, target_y):
         """Generate a movement function based on recorded patterns"""
-        if not self.movements:
+        if not len(self.track):
             print("❌ No movement data to analyze")
             return None
             
@@ -168,17 +191,18 @@ class MouseMovementAnalyzer:
         print(f"\n🧬 GENERATING HUMAN-LIKE MOVEMENT TO ({target_x}, {target_y})")
         
         # Extract movement characteristics
-        total_duration = self.movements[-1]["timestamp"]
-        start_x, start_y = self.movements[0]["x"], self.movements[0]["y"]
-        end_x, end_y = self.movements[-1]["x"], self.movements[-1]["y"]
+        total_duration = float(self.track["t"][-1])
+        start_x, start_y = int(self.track["x"][0]), int(self.track["y"][0])
+        end_x, end_y = int(self.track["x"][-1]), int(self.track["y"][-1])
         
         print(f"📍 Original movement: ({start_x}, {start_y}) → ({end_x}, {end_y})")
         print(f"⏱️  Duration: {total_duration:.2f} seconds")
         
         # Generate movement commands (simplified example)
         movement_commands = []
-        for i, movement in enumerate(self.movements[::5]):  # Subsample
-            progress = i / (len(self.movements[::5]) - 1)
+        subsampled = self.track["t"][::5].tolist()  # Subsample
+        for i, timestamp in enumerate(subsampled):
+            progress = i / (len(subsampled) - 1)
             # Map to new target
             new_x = start_x + (target_x - start_x) * progress
             new_y = start_y + (target_y - start_y) * progress
@@ -186,7 +210,7 @@ class MouseMovementAnalyzer:
             movement_commands.append({
                 "x": int(new_x),
                 "y": int(new_y),
-                "delay": movement["timestamp"] / total_duration
+                "delay": timestamp / total_duration
             })
             
         return movement_commands
@@ -194,6 +218,20 @@ class MouseMovementAnalyzer:
 def main():
     analyzer = MouseMovementAnalyzer()
     
+    parser = argparse.ArgumentParser(description="Record and analyse human mouse movements")
+    parser.add_argument("recording", nargs="?", help="Analyse a saved recording (.npy or .json) and exit")
+    parser.add_argument("--convert", nargs="+", metavar="JSON", help="Convert JSON recordings to the compact format and exit")
+    args = parser.parse_args()
+    
+    if args.convert:
+        for path in args.convert:
+            convert_recording(path)
+        return
+    if args.recording:
+        analyzer.load_recording(args.recording)
+        analyzer.analyze_movements(save=False)
+        return
+    
     print("Human Mouse Movement Analyzer")
     print("=" * 40)
     print("1. Record mouse movement")
@@ -214,7 +252,7 @@ def main():
             analyzer.analyze_movements()
             
         elif choice == "3":
-            if analyzer.movements:
+            if len(analyzer.track):
                 target_x = int(input("Target X coordinate: "))
                 target_y = int(input("Target Y coordinate: "))
                 commands = analyzer.generate_human_movement_function(target_x, target_y)
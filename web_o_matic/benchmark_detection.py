@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+benchmark_detection.py
+
+Purpose:
+Headless benchmark of the detection pipeline in web_o_matic_precision_human_click_v6_fixed.py.
+Times load_and_crop_zone, find_best_match_in_zone, find_target and find_targets on the
+bundled current_screenshot.png and on synthetic screenshots at several resolutions, and
+reports per-stage latency percentiles, throughput and peak memory. Also measures cold-start
+import time of the main script in fresh interpreters (python -X importtime), with heavy
+libraries deferred (the default) and imported eagerly, against STARTUP_BUDGET_MS.
+
+pyautogui is replaced by a stub when no display is available, so this runs on CI boxes.
+
+Usage:
+    python benchmark_detection.py --iterations 20 --json bench.json
+"""
+
+import os
+import sys
+import io
+import json
+import time
+import types
+import tempfile
+import argparse
+import statistics
+import subprocess
+import tracemalloc
+import contextlib
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SYNTHETIC_RESOLUTIONS = [(1600, 900), (2560, 1440), (3200, 1800)]
+MAIN_MODULE = "web_o_matic_precision_human_click_v6_fixed"
+STARTUP_BUDGET_MS = 100.0   # Import of the main script with heavy libraries deferred
+
+# Run in a fresh interpreter: import the main script, standing in an empty pyautogui if it isn't installed
+STARTUP_SNIPPET = """
+import sys, types, importlib.util
+sys.path.insert(0, {base_dir!r})
+if importlib.util.find_spec("pyautogui") is None:
+    sys.modules["pyautogui"] = types.ModuleType("pyautogui")
+import {module}
+"""
+
+
+def install_pyautogui_stub():
+    """Use a stub pyautogui when the real one can't talk to a display"""
+    if "pyautogui" in sys.modules:
+        return False
+    if os.environ.get("DISPLAY") or sys.platform in ("darwin", "win32"):
+        try:
+            import pyautogui  # noqa: F401
+            return False
+        except Exception:
+            pass
+
+    stub = types.ModuleType("pyautogui")
+    stub.FAILSAFE = False
+    stub._frame = None
+
+    def screenshot(region=None):
+        from PIL import Image
+        import cv2
+        frame = stub._frame
+        if region is not None:
+            left, top, width, height = region
+            frame = frame[top:top + height, left:left + width]
+        return Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+    stub.screenshot = screenshot
+    stub.position = lambda: (0, 0)
+    stub.size = lambda: (1600, 900)
+    for name in ("moveTo", "click", "mouseDown", "mouseUp", "press", "hotkey", "typewrite", "dragTo"):
+        setattr(stub, name, lambda *args, **kwargs: None)
+    sys.modules["pyautogui"] = stub
+    return True
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+@contextlib.contextmanager
+def quiet():
+    """Swallow the pipeline's progress prints so terminal I/O isn't part of the timing"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def time_stage(func, iterations, warmup=1):
+    """Run func repeatedly; returns latency stats (ms), throughput and peak traced memory"""
+    with quiet():
+        for _ in range(warmup):
+            func()
+
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000.0)
+
+        # Separate pass for memory: tracemalloc slows allocation down
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    samples.sort()
+    total_s = sum(samples) / 1000.0
+    return {
+        "iterations": iterations,
+        "mean_ms": sum(samples) / len(samples),
+        "p50_ms": percentile(samples, 50),
+        "p90_ms": percentile(samples, 90),
+        "p99_ms": percentile(samples, 99),
+        "min_ms": samples[0],
+        "max_ms": samples[-1],
+        "ops_per_sec": iterations / total_s if total_s > 0 else float("inf"),
+        "peak_mem_mb": peak / (1024 * 1024)
+    }
+
+
+def parse_importtime(stderr):
+    """Parse `python -X importtime` output into {module: (self_us, cumulative_us)}"""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            timings[name.strip()] = (int(self_us), int(cumulative_us))
+        except ValueError:
+            continue
+    return timings
+
+
+def measure_startup(runs=5, module=MAIN_MODULE):
+    """Cold-start import cost of a module, lazy vs eager heavy imports, in fresh interpreters"""
+    code = STARTUP_SNIPPET.format(base_dir=BASE_DIR, module=module)
+    report = {"module": module, "budget_ms": STARTUP_BUDGET_MS}
+    for mode in ("lazy", "eager"):
+        env = dict(os.environ)
+        env.pop("WEB_O_MATIC_EAGER_IMPORTS", None)
+        if mode == "eager":
+            env["WEB_O_MATIC_EAGER_IMPORTS"] = "1"
+        wall_ms, import_ms, timings = [], [], {}
+        for _ in range(runs):
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                    capture_output=True, text=True, env=env, cwd=BASE_DIR)
+            wall_ms.append((time.perf_counter() - start) * 1000.0)
+            if result.returncode != 0:
+                report[mode] = {"error": result.stderr.strip().splitlines()[-1]}
+                break
+            timings = parse_importtime(result.stderr)
+            import_ms.append(timings.get(module, (0, 0))[1] / 1000.0)
+        else:
+            slowest = sorted(timings.items(), key=lambda item: -item[1][0])[:8]
+            report[mode] = {
+                "wall_ms_median": statistics.median(wall_ms),
+                "import_ms_median": statistics.median(import_ms),
+                "import_ms_min": min(import_ms),
+                "slowest_self_ms": {name: self_us / 1000.0 for name, (self_us, _) in slowest}
+            }
+    lazy = report.get("lazy", {})
+    report["within_budget"] = "import_ms_median" in lazy and lazy["import_ms_median"] <= STARTUP_BUDGET_MS
+    return report
+
+
+def print_startup(report):
+    print(f"\n🚀 Startup: import {report['module']}")
+    for mode in ("lazy", "eager"):
+        stats = report.get(mode, {})
+        if "error" in stats:
+            print(f"   {mode:6s} ❌ {stats['error']}")
+            continue
+        print(f"   {mode:6s} import p50 {stats['import_ms_median']:7.1f}ms  min {stats['import_ms_min']:7.1f}ms  "
+              f"process p50 {stats['wall_ms_median']:7.1f}ms")
+        slowest = ", ".join(f"{name} {ms:.1f}ms" for name, ms in list(stats["slowest_self_ms"].items())[:4])
+        print(f"          slowest: {slowest}")
+    verdict = "✅ within" if report["within_budget"] else "⚠️ over"
+    print(f"   {verdict} the {report['budget_ms']:.0f}ms budget")
+
+
+def make_synthetic_frame(precision, base_frame, width, height):
+    """Resize the bundled screenshot and paste each target's template into the middle of its zone"""
+    import cv2
+    frame = cv2.resize(base_frame, (width, height), interpolation=cv2.INTER_AREA)
+    with quiet():
+        precision.update_frame_scale(width, height)
+        for target_name, config in precision.TARGET_ZONES.items():
+            if not config.get("ref_image"):
+                continue
+            template = precision.templates.get(precision.ref_image_full_path(config["ref_image"]))
+            if template is None:
+                continue
+            left, top, zone_w, zone_h = precision.get_zone_bounds(config["grid_zone"])
+            tmpl_h, tmpl_w = template.shape[:2]
+            if tmpl_w > zone_w or tmpl_h > zone_h:
+                continue
+            x = left + (zone_w - tmpl_w) // 2
+            y = top + (zone_h - tmpl_h) // 2
+            frame[y:y + tmpl_h, x:x + tmpl_w] = template
+    return frame
+
+
+def run_benchmarks(iterations, use_caches=False, resolutions=SYNTHETIC_RESOLUTIONS):
+    stubbed = install_pyautogui_stub()
+    sys.path.insert(0, BASE_DIR)
+    import cv2
+    import web_o_matic_precision_human_click_v6_fixed as wom
+    from log_config import configure_logging
+
+    # Only problems reach the terminal while timing
+    configure_logging("WARNING")
+
+    with quiet():
+        precision = wom.WebOMatic_Precision()
+    # Keep calibration out of the working tree so runs don't affect each other
+    precision.calibration_path = os.path.join(tempfile.mkdtemp(prefix="wom_bench_"), "display_calibration.json")
+    precision.display_calibration = {}
+
+    screenshot_path = os.path.join(BASE_DIR, "current_screenshot.png")
+    base_frame = cv2.imread(screenshot_path)
+    targets = [name for name, config in precision.TARGET_ZONES.items() if config.get("ref_image")]
+    first_target = targets[0]
+    first_config = precision.TARGET_ZONES[first_target]
+    first_ref = precision.ref_image_full_path(first_config["ref_image"])
+
+    def fresh(func):
+        # Without caches every call pays for the full match
+        if use_caches:
+            return func
+
+        def wrapped():
+            precision.match_cache.clear()
+            return func()
+        return wrapped
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "opencv": cv2.__version__,
+        "pyautogui_stubbed": stubbed,
+        "caches": use_caches,
+        "targets": targets,
+        "inputs": {}
+    }
+
+    inputs = [("current_screenshot.png", base_frame)]
+    for width, height in resolutions:
+        inputs.append((f"synthetic_{width}x{height}", make_synthetic_frame(precision, base_frame, width, height)))
+
+    for label, frame in inputs:
+        height, width = frame.shape[:2]
+        print(f"\n📊 {label} ({width}x{height})")
+        stages = {}
+        if label == "current_screenshot.png":
+            stages["load_and_crop_zone[path]"] = time_stage(
+                lambda: precision.load_and_crop_zone(screenshot_path, first_config["grid_zone"]), iterations)
+        stages["load_and_crop_zone[frame]"] = time_stage(
+            lambda: precision.load_and_crop_zone(frame, first_config["grid_zone"]), iterations)
+        stages["find_best_match_in_zone"] = time_stage(
+            fresh(lambda: precision.find_best_match_in_zone(frame, first_ref, first_config["grid_zone"])), iterations)
+        stages["find_target"] = time_stage(
+            fresh(lambda: precision.find_target(first_target, frame=frame)), iterations)
+        stages["find_targets"] = time_stage(
+            fresh(lambda: precision.find_targets(targets, frame)), iterations)
+
+        for stage, stats in stages.items():
+            print(f"   {stage:28s} p50 {stats['p50_ms']:8.2f}ms  p90 {stats['p90_ms']:8.2f}ms  "
+                  f"p99 {stats['p99_ms']:8.2f}ms  {stats['ops_per_sec']:8.1f}/s  peak {stats['peak_mem_mb']:6.1f}MB")
+
+        with quiet():
+            found = precision.find_targets(targets, frame)
+        report["inputs"][label] = {
+            "frame_size": [width, height],
+            "stages": stages,
+            "found": {name: match is not None for name, match in found.items()}
+        }
+
+    try:
+        import resource
+        report["max_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    except ImportError:
+        pass
+    report["match_cache"] = precision.match_cache.stats()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Web-O-Matic detection pipeline")
+    parser.add_argument("--iterations", type=int, default=10, help="Timed runs per stage")
+    parser.add_argument("--caches", action="store_true", help="Leave the match-result cache on (measures warm lookups)")
+    parser.add_argument("--json", help="Write the report to this JSON file")
+    parser.add_argument("--startup-runs", type=int, default=5, help="Fresh interpreters per startup measurement (0 to skip)")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.iterations, use_caches=args.caches)
+    if args.startup_runs > 0:
+        report["startup"] = measure_startup(args.startup_runs)
+        print_startup(report["startup"])
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
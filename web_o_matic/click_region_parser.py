@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+click_region_parser.py
+
+Purpose:
+Pick click_region(top=.., left=.., width=.., height=..) tuples out of Kai's reply while it
+is still arriving, so a click can be queued before the rest of the reply has rendered.
+
+The grammar is loose on purpose, to survive OCR:
+- O/o read as 0 and l/I/| read as 1, in the numbers and in the keywords ("t0p", "1eft")
+- missing or extra spaces, "click region" / "clickregion", "=" read as ":" or dropped
+- ( ) read as [ ] or { }
+
+A tuple counts as complete once something other than a digit (or a space and then more
+text) follows its height, so "height=4" is not emitted while "height=40" is still streaming in.
+
+    parser = ClickRegionParser()
+    for chunk in chunks:                  # appended text, e.g. a clipboard stream
+        for region in parser.feed(chunk):
+            ...
+    parser.update(ocr_text)               # or: the whole text so far, e.g. repeated OCR
+"""
+
+import re
+
+FIELDS = ("top", "left", "width", "height")
+
+# Characters OCR confuses with digits, and the digit they stand for
+_DIGIT_LOOKALIKES = "OoIil|"
+_DIGIT_FIXES = str.maketrans(_DIGIT_LOOKALIKES, "001111")
+_NUMBER = r"[0-9" + re.escape(_DIGIT_LOOKALIKES) + r"]+"
+
+# Keyword letters OCR confuses with digits (matching is case-insensitive)
+_LETTER_CLASSES = {"o": "[o0]", "l": "[l1|i]", "i": "[i1l|]"}
+
+# Longest text a tuple in progress can span; older unmatched text is dropped
+MAX_PENDING = 256
+
+# update() rescans from this many characters before the last emitted tuple's end, so OCR noise
+# that shortens the text a little can't cut off the next tuple (far less than a whole tuple)
+RESUME_SLACK = 8
+
+
+def _fuzzy(word):
+    return "".join(_LETTER_CLASSES.get(c, re.escape(c)) for c in word)
+
+
+def _build_pattern(at_end):
+    fields = r"\s*[,.;]?\s*".join(
+        fr"{_fuzzy(name)}\s*[=:]?\s*(?P<{name}>{_NUMBER})" for name in FIELDS)
+    # Complete once a non-digit or a word gap follows the height (or, for finished text, at the very end)
+    terminator = r"(?=[^\s" + re.escape(_DIGIT_LOOKALIKES) + r"0-9]|\s+\S" + (r"|\s*\Z)" if at_end else ")")
+    return re.compile(fr"{_fuzzy('click')}[\s_\-]*{_fuzzy('region')}\s*[(\[{{]\s*{fields}{terminator}",
+                      re.IGNORECASE)
+
+
+STREAM_PATTERN = _build_pattern(at_end=False)
+FINAL_PATTERN = _build_pattern(at_end=True)
+
+
+def _region(match):
+    """(top, left, width, height) ints from a match, undoing digit look-alikes"""
+    return tuple(int(match.group(name).translate(_DIGIT_FIXES)) for name in FIELDS)
+
+
+def parse_click_regions(text):
+    """All complete click_region tuples in a finished piece of text"""
+    return [_region(match) for match in FINAL_PATTERN.finditer(text)]
+
+
+class ClickRegionParser:
+    """Incremental click_region parser: each tuple is emitted once, as soon as it is complete"""
+
+    def __init__(self):
+        self._pending = ""      # Appended text not yet consumed by a match (feed mode)
+        self._resume = 0        # Offset just past the last tuple emitted from the whole text (update mode)
+        self.regions = []
+
+    def feed(self, chunk):
+        """Append newly arrived text; returns the tuples completed by it"""
+        self._pending += chunk
+        found = []
+        consumed = 0
+        for match in STREAM_PATTERN.finditer(self._pending):
+            found.append(_region(match))
+            consumed = match.end()
+        self._pending = self._pending[consumed:][-MAX_PENDING:]
+        self.regions.extend(found)
+        return found
+
+    def update(self, text, final=False):
+        """Take the whole text so far (e.g. a fresh OCR of the reply); returns tuples not seen before.
+
+        Scanning resumes where the last emitted tuple ended (less RESUME_SLACK), so earlier
+        tuples are skipped by position and never emitted twice. Pass final=True for the finished reply.
+        """
+        pattern = FINAL_PATTERN if final else STREAM_PATTERN
+        found = []
+        for match in pattern.finditer(text, max(0, self._resume - RESUME_SLACK)):
+            found.append(_region(match))
+            self._resume = match.end()
+        self.regions.extend(found)
+        return found
+
+    def flush(self):
+        """End of text: a tuple ending right at the end of the stream counts as complete"""
+        found = []
+        if self._pending:
+            found = [_region(match) for match in FINAL_PATTERN.finditer(self._pending)]
+            self._pending = ""
+        self.regions.extend(found)
+        return found
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+file_watch.py
+
+Purpose:
+Event-driven watching of a single file (e.g. kai_click_intent.json), so a consumer reacts
+within milliseconds of a write instead of on its next poll.
+- watchdog: FSEvents / inotify / ReadDirectoryChangesW through the watchdog package (optional)
+- inotify: Linux inotify through ctypes, no extra packages; fires on close-write and rename-into-place
+- poll: os.stat() every poll_interval seconds, works everywhere
+
+FileWatcher debounces: the callback runs once the file has been quiet for `debounce`
+seconds, so a writer that flushes in several chunks triggers one read of the finished file -
+but never later than `max_delay` after the first write of a burst, so a steady stream of
+writes still gets delivered. A file renamed into place is complete, so that fires at once.
+
+Select a backend with FileWatcher(..., backend="inotify" | "watchdog" | "poll" | "auto")
+or the WEB_O_MATIC_WATCH environment variable.
+"""
+
+import os
+import time
+import queue
+import select
+import struct
+import ctypes
+import ctypes.util
+import threading
+from log_config import get_logger
+
+WATCH_ENV_VAR = "WEB_O_MATIC_WATCH"
+
+# WatchSource.wait() results: nothing, an in-place write, or a complete file renamed into place
+UNCHANGED = 0
+CHANGED = 1
+REPLACED = 2
+
+log = get_logger("file_watch")
+
+
+class WatchSource:
+    """Reports changes to one file: wait(timeout) returns UNCHANGED, CHANGED or REPLACED"""
+    name = "base"
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.directory, self.filename = os.path.split(self.path)
+
+    def wait(self, timeout):
+        raise NotImplementedError
+
+    def wake(self):
+        """Make a blocked wait() return early (called from another thread)"""
+        pass
+
+    def close(self):
+        pass
+
+
+class PollingSource(WatchSource):
+    """stat() the file every poll_interval seconds and compare mtime/size/inode"""
+    name = "poll"
+
+    def __init__(self, path, poll_interval=0.25):
+        super().__init__(path)
+        self.poll_interval = poll_interval
+        self._signature = self._stat()
+        self._closed = threading.Event()
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def wait(self, timeout):
+        interval = self.poll_interval if timeout is None else min(timeout, self.poll_interval)
+        self._closed.wait(interval)
+        signature = self._stat()
+        changed = signature is not None and signature != self._signature
+        self._signature = signature
+        return CHANGED if changed else UNCHANGED
+
+    def wake(self):
+        self._closed.set()
+
+
+class InotifySource(WatchSource):
+    """Linux inotify on the parent directory, filtered to our filename"""
+    name = "inotify"
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    _EVENT_HEADER = struct.Struct("iIII")   # wd, mask, cookie, len (name follows)
+
+    def __init__(self, path):
+        super().__init__(path)
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise RuntimeError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise RuntimeError("inotify not available on this platform")
+
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # Watch the directory: writers that rename a temp file into place replace the inode
+        wd = libc.inotify_add_watch(self.fd, os.fsencode(self.directory), self.IN_CLOSE_WRITE | self.IN_MOVED_TO)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed for {self.directory}")
+        # Self-pipe so wake() can interrupt a blocked wait()
+        self._wake_r, self._wake_w = os.pipe()
+        self._target = os.fsencode(self.filename)
+
+    def wait(self, timeout):
+        readable, _, _ = select.select([self.fd, self._wake_r], [], [], timeout)
+        if self.fd not in readable:
+            return UNCHANGED
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return UNCHANGED
+
+        changed = UNCHANGED
+        offset = 0
+        while offset + self._EVENT_HEADER.size <= len(data):
+            _, mask, _, name_len = self._EVENT_HEADER.unpack_from(data, offset)
+            offset += self._EVENT_HEADER.size
+            name = data[offset:offset + name_len].rstrip(b"\0")
+            offset += name_len
+            if name == self._target:
+                changed = max(changed, REPLACED if mask & self.IN_MOVED_TO else CHANGED)
+        return changed
+
+    def wake(self):
+        if self.fd is not None:
+            os.write(self._wake_w, b"x")
+
+    def close(self):
+        if self.fd is None:
+            return
+        for fd in (self.fd, self._wake_r, self._wake_w):
+            os.close(fd)
+        self.fd = None
+
+
+class WatchdogSource(WatchSource):
+    """watchdog observer (native backend per OS) feeding a queue"""
+    name = "watchdog"
+
+    def __init__(self, path):
+        super().__init__(path)
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+
+        self._events = queue.SimpleQueue()
+        source = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                dest_path = getattr(event, "dest_path", None)
+                if event.event_type == "moved" and dest_path and os.path.abspath(dest_path) == source.path:
+                    source._events.put(REPLACED)
+                elif event.event_type != "deleted" and os.path.abspath(event.src_path) == source.path:
+                    source._events.put(CHANGED)
+
+        self._observer = Observer()
+        self._observer.schedule(_Handler(), self.directory, recursive=False)
+        self._observer.start()
+
+    def wait(self, timeout):
+        try:
+            return self._events.get(timeout=timeout)
+        except queue.Empty:
+            return UNCHANGED
+
+    def wake(self):
+        self._events.put(UNCHANGED)
+
+    def close(self):
+        self._observer.stop()
+        self._observer.join(timeout=2.0)
+
+
+WATCH_BACKENDS = {
+    "inotify": InotifySource,
+    "watchdog": WatchdogSource,
+    "poll": PollingSource
+}
+
+AUTO_ORDER = ("inotify", "watchdog", "poll")
+
+
+def make_watch_source(path, backend=None):
+    """Create a watch source by name ("auto" picks the first one that works here)"""
+    backend = (backend or os.environ.get(WATCH_ENV_VAR) or "auto").lower()
+    if backend != "auto":
+        if backend not in WATCH_BACKENDS:
+            raise ValueError(f"Unknown watch backend: {backend} (choose from {', '.join(WATCH_BACKENDS)} or auto)")
+        return WATCH_BACKENDS[backend](path)
+
+    errors = []
+    for name in AUTO_ORDER:
+        try:
+            return WATCH_BACKENDS[name](path)
+        except Exception as e:
+            errors.append(f"{name}: {e}")
+    raise RuntimeError("No watch backend available - " + "; ".join(errors))
+
+
+class FileWatcher:
+    """Calls callback(path) on a background thread once the file changes and then stays quiet"""
+
+    def __init__(self, path, callback, debounce=0.02, backend=None, max_delay=None):
+        self.path = os.path.abspath(path)
+        self.callback = callback
+        self.debounce = debounce    # Seconds without further events before the callback fires
+        # Longest a burst of writes can hold the callback back, from its first event
+        self.max_delay = debounce if max_delay is None else max_delay
+        self.backend = backend
+        self.source = None
+        self._thread = None
+        self._running = False
+
+    @property
+    def running(self):
+        return self._running
+
+    def start(self):
+        """Open the watch backend and start the watcher thread (no-op if already running)"""
+        if self._running:
+            return
+        self.source = make_watch_source(self.path, self.backend)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        log.info("👀 Watching %s (%s backend)", self.path, self.source.name)
+
+    def stop(self):
+        """Stop the watcher thread and release the backend"""
+        self._running = False
+        if self.source is not None:
+            self.source.wake()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+        if self.source is not None:
+            self.source.close()
+            self.source = None
+
+    def _run(self):
+        fire_at = None
+        burst_start = None
+        while self._running:
+            timeout = None if fire_at is None else max(0.0, fire_at - time.monotonic())
+            # Wake at least twice a second so stop() is noticed by every backend
+            changed = self.source.wait(0.5 if timeout is None else min(timeout, 0.5))
+            if not self._running:
+                break
+            now = time.monotonic()
+            if changed == REPLACED:
+                fire_at = now
+            elif changed:
+                if burst_start is None:
+                    burst_start = now
+                fire_at = min(now + self.debounce, burst_start + self.max_delay)
+            if fire_at is not None and now >= fire_at:
+                fire_at = burst_start = None
+                try:
+                    self.callback(self.path)
+                except Exception as e:
+                    log.error("❌ Watch callback failed for %s: %s", self.path, e)
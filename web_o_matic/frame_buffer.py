@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+frame_buffer.py
+
+Purpose:
+Background screen capture into a fixed-size ring buffer, so callers can wait for the
+UI to settle instead of sleeping for a worst-case delay.
+- FrameRingBuffer: last N frames with sequence numbers and capture timestamps
+- ContinuousCapture: capture thread feeding the buffer from a screen_capture backend
+- wait_for_stable_frame(): returns as soon as a zone stops changing between frames
+"""
+
+import time
+import threading
+from collections import deque
+from log_config import get_logger
+from lazy_import import lazy_import
+
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+
+log = get_logger("frame_buffer")
+
+class FrameRingBuffer:
+    """Thread-safe ring of the most recent frames: entries are (seq, timestamp, frame)"""
+
+    def __init__(self, size=4):
+        self.size = size
+        self._frames = deque(maxlen=size)
+        self._seq = 0
+        self._condition = threading.Condition()
+
+    def push(self, frame, timestamp=None):
+        """Add a frame (dropping the oldest when full) and wake any waiters"""
+        with self._condition:
+            self._seq += 1
+            self._frames.append((self._seq, timestamp or time.time(), frame))
+            self._condition.notify_all()
+            return self._seq
+
+    def latest(self):
+        """Most recent entry, or None if nothing has been captured yet"""
+        with self._condition:
+            return self._frames[-1] if self._frames else None
+
+    def wait_for_new(self, after_seq, timeout):
+        """Block until a frame newer than after_seq arrives; returns its entry or None on timeout"""
+        deadline = time.time() + timeout
+        with self._condition:
+            while not self._frames or self._frames[-1][0] <= after_seq:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+            return self._frames[-1]
+
+    def snapshot(self):
+        """Copy of all buffered entries, oldest first"""
+        with self._condition:
+            return list(self._frames)
+
+
+def zone_signature(frame, region, downsample=8):
+    """Cheap fingerprint of a region: small grayscale thumbnail for frame differencing"""
+    left, top, width, height = region
+    crop = frame[max(0, top):top + height, max(0, left):left + width]
+    if crop.size == 0:
+        return None
+    small = cv2.resize(crop, (max(1, crop.shape[1] // downsample), max(1, crop.shape[0] // downsample)),
+                       interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+
+
+def signatures_differ(sig_a, sig_b, threshold=2.0):
+    """True if two zone signatures differ by more than threshold (mean absolute grey level)"""
+    if sig_a is None or sig_b is None or sig_a.shape != sig_b.shape:
+        return True
+    return float(np.mean(cv2.absdiff(sig_a, sig_b))) > threshold
+
+
+class ContinuousCapture:
+    """Capture thread that keeps a FrameRingBuffer filled from a screen_capture backend"""
+
+    def __init__(self, capture, size=4, interval=0.05, region=None):
+        self.capture = capture
+        self.buffer = FrameRingBuffer(size)
+        self.interval = interval    # Target seconds between grabs
+        self.region = region        # Grab only this (left, top, width, height), or the full screen
+        self.origin = (region[0], region[1]) if region else (0, 0)
+        self._thread = None
+        self._running = False
+
+    @property
+    def running(self):
+        return self._running
+
+    def frame_origin(self):
+        """(left, top) of the grabbed region, or None when the buffer holds full-screen frames"""
+        return self.origin if self.region else None
+
+    def start(self):
+        """Start the capture thread (no-op if already running)"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        log.info("🎞️ Continuous capture started (%.0f fps target, %s frame buffer)", 1.0 / self.interval, self.buffer.size)
+
+    def stop(self):
+        """Stop the capture thread and wait for it to exit"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        log.info("🎞️ Continuous capture stopped")
+
+    def _run(self):
+        while self._running:
+            started = time.time()
+            try:
+                frame = self.capture.grab(self.region)
+                self.buffer.push(frame, started)
+            except Exception as e:
+                log.warning("⚠️ Continuous capture failed: %s", e)
+            elapsed = time.time() - started
+            if elapsed < self.interval:
+                time.sleep(self.interval - elapsed)
+
+    def wait_for_stable_frame(self, zone, timeout=3.0, stable_frames=2, threshold=2.0, since=None):
+        """Wait until the zone stops changing and return the latest frame, or None on timeout.
+
+        zone is (left, top, width, height) in full-screen pixels. The zone counts as stable
+        once stable_frames consecutive frame pairs differ by no more than threshold. Frames
+        captured before `since` (a time.time() value) are ignored, so a wait started right
+        after an action can't be satisfied by frames from before the action.
+        """
+        left, top, width, height = zone
+        region = (left - self.origin[0], top - self.origin[1], width, height)
+        deadline = time.time() + timeout
+
+        last_seq = 0
+        previous = None
+        unchanged = 0
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            entry = self.buffer.wait_for_new(last_seq, remaining)
+            if entry is None:
+                return None
+            last_seq, timestamp, frame = entry
+            if since is not None and timestamp < since:
+                continue
+
+            signature = zone_signature(frame, region)
+            if previous is not None and not signatures_differ(previous, signature, threshold):
+                unchanged += 1
+                if unchanged >= stable_frames:
+                    return frame
+            else:
+                unchanged = 0
+            previous = signature
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+intent_queue.py
+
+Purpose:
+Append-only spool of click intents, replacing the single kai_click_intent.json that every
+producer overwrote (losing back-to-back intents and letting readers see half-written files).
+
+Layout under the spool directory:
+    tmp/        records being written
+    pending/    published records, one <seq>.json each (12-digit sequence number)
+    inflight/   records a consumer has claimed but not yet acknowledged
+    done/       acknowledged records (history; the consumer trims it with prune())
+    head        last published sequence number, rewritten after every put
+    lock        flock()ed by put() while it numbers and publishes a record
+
+- put() holds the lock file across processes, takes the number after head, writes the
+  record to tmp/ and hard-links it into pending/ - never a partial file, never an
+  overwrite, never a number reused after its record moved on to inflight/ or done/
+- claim() renames a record from pending/ to inflight/, so two consumers can't both take it
+- ack() moves it to done/; requeue_inflight() hands back records of a consumer that died
+- consumers can watch the head file with file_watch.FileWatcher to wake on new intents
+"""
+
+import os
+import json
+import fcntl
+import time
+import threading
+from log_config import get_logger
+
+SEQ_DIGITS = 12
+
+log = get_logger("intent_queue")
+
+
+class IntentQueue:
+    """Spool-directory intent queue with sequence numbers and consumer acknowledgements"""
+
+    def __init__(self, spool_dir):
+        self.spool_dir = spool_dir
+        self.tmp_dir = os.path.join(spool_dir, "tmp")
+        self.pending_dir = os.path.join(spool_dir, "pending")
+        self.inflight_dir = os.path.join(spool_dir, "inflight")
+        self.done_dir = os.path.join(spool_dir, "done")
+        self.head_path = os.path.join(spool_dir, "head")
+        for directory in (self.tmp_dir, self.pending_dir, self.inflight_dir, self.done_dir):
+            os.makedirs(directory, exist_ok=True)
+        self.lock_path = os.path.join(spool_dir, "lock")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _name(seq):
+        return f"{seq:0{SEQ_DIGITS}d}.json"
+
+    @staticmethod
+    def _seqs(directory):
+        return sorted(int(name[:-5]) for name in os.listdir(directory)
+                      if name.endswith(".json") and name[:-5].isdigit())
+
+    def last_seq(self):
+        """Highest sequence number published so far (0 for an empty queue).
+
+        done/ isn't listed - it can hold a long history, and head already covers everything
+        acknowledged. pending/ and inflight/ catch a producer that died before writing head.
+        """
+        try:
+            with open(self.head_path, "r") as f:
+                head = int(f.read().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            head = 0
+        for directory in (self.pending_dir, self.inflight_dir):
+            seqs = self._seqs(directory)
+            if seqs:
+                head = max(head, seqs[-1])
+        return head
+
+    def put(self, intent):
+        """Publish an intent (a JSON-serialisable dict); returns its sequence number"""
+        with self._lock, open(self.lock_path, "a") as lock:
+            # Producers in other processes take the same lock, so numbering and head stay in step
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            seq = self.last_seq() + 1
+            while os.path.exists(os.path.join(self.done_dir, self._name(seq))):
+                # Already handled, but head was never written for it (its producer died)
+                seq += 1
+            record = {"seq": seq, "enqueued_at": time.time(), "intent": intent}
+            tmp_path = os.path.join(self.tmp_dir, f"{os.getpid()}-{threading.get_ident()}.json")
+            with open(tmp_path, "w") as f:
+                json.dump(record, f)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                # link() never replaces an existing file, so a reader only ever sees a complete record
+                os.link(tmp_path, os.path.join(self.pending_dir, self._name(seq)))
+            finally:
+                os.unlink(tmp_path)
+            self._write_head(seq)
+        log.debug("📥 Queued intent #%s: %s", seq, intent.get("intent", "?"))
+        return seq
+
+    def _write_head(self, seq):
+        """Rewrite the head file via rename so watchers see one complete update per put"""
+        tmp_path = os.path.join(self.tmp_dir, f"head-{os.getpid()}-{threading.get_ident()}")
+        with open(tmp_path, "w") as f:
+            f.write(str(seq))
+        os.replace(tmp_path, self.head_path)
+
+    def pending(self):
+        """Sequence numbers waiting to be claimed, oldest first"""
+        return self._seqs(self.pending_dir)
+
+    def claim(self):
+        """Take the oldest pending intent: returns (seq, intent) or None when the queue is empty"""
+        for seq in self.pending():
+            name = self._name(seq)
+            inflight_path = os.path.join(self.inflight_dir, name)
+            try:
+                os.rename(os.path.join(self.pending_dir, name), inflight_path)
+            except FileNotFoundError:
+                continue    # Claimed by another consumer first
+            try:
+                with open(inflight_path, "r") as f:
+                    record = json.load(f)
+            except ValueError as e:
+                log.error("❌ Dropping unreadable intent #%s: %s", seq, e)
+                self.ack(seq)
+                continue
+            return seq, record["intent"]
+        return None
+
+    def ack(self, seq):
+        """Mark a claimed intent as handled"""
+        name = self._name(seq)
+        try:
+            os.replace(os.path.join(self.inflight_dir, name), os.path.join(self.done_dir, name))
+        except FileNotFoundError:
+            log.warning("⚠️ Ack for intent #%s that is not in flight", seq)
+
+    def requeue_inflight(self):
+        """Put claimed-but-unacknowledged intents back (run once when a consumer starts)"""
+        seqs = self._seqs(self.inflight_dir)
+        for seq in seqs:
+            name = self._name(seq)
+            os.replace(os.path.join(self.inflight_dir, name), os.path.join(self.pending_dir, name))
+        if seqs:
+            log.info("↩️ Requeued %d unacknowledged intents", len(seqs))
+        return len(seqs)
+
+    def drain(self, handler):
+        """Claim, handle and ack every pending intent in order; returns how many were handled.
+
+        An intent whose handler raises is still acknowledged, so one bad intent can't
+        block the queue - the error is logged.
+        """
+        handled = 0
+        while True:
+            item = self.claim()
+            if item is None:
+                return handled
+            seq, intent = item
+            try:
+                handler(seq, intent)
+            except Exception as e:
+                log.error("❌ Intent #%s failed: %s", seq, e)
+            self.ack(seq)
+            handled += 1
+
+    def prune(self, keep=1000):
+        """Delete all but the newest `keep` acknowledged intents"""
+        seqs = self._seqs(self.done_dir)
+        for seq in seqs[:max(0, len(seqs) - keep)]:
+            try:
+                os.unlink(os.path.join(self.done_dir, self._name(seq)))
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,711 @@
+#!/usr/bin/env python3
+"""
+Kai Complete Navigation System - HUMAN MOVEMENT SIGNATURE VERSION
+- Implements Jon's natural mouse movement patterns for browser detection evasion
+- Activates browser window before mouse movement
+- Uses realistic velocity curves and settling behavior
+"""
+
+import subprocess
+import time
+import os
+import json
+import threading
+from datetime import datetime
+import shutil
+import random
+import math
+from screen_capture import make_capture
+from frame_buffer import zone_signature, signatures_differ
+from file_watch import FileWatcher
+from intent_queue import IntentQueue
+from ocr_engine import OCRReader, CLICK_REGION_WHITELIST
+from click_region_parser import ClickRegionParser, parse_click_regions
+from lazy_import import lazy_import, preload
+
+# Heavy libraries load on first use
+pyautogui = lazy_import("pyautogui")
+pyperclip = lazy_import("pyperclip")
+cv2 = lazy_import("cv2")
+
+class KaiNavigationSystem:
+    def __init__(self, capture_backend=None):
+        self.base_dir = os.path.expanduser("~/Desktop/kai_system")
+        self.ensure_directory()
+        
+        # File paths
+        self.screenshot_path = os.path.join(self.base_dir, "current_screenshot.png")
+        self.kai_read_path = os.path.join(self.base_dir, "kai_ui_read.png")
+        self.intent_path = os.path.join(self.base_dir, "kai_click_intent.json")
+        self.intent_queue = IntentQueue(os.path.join(self.base_dir, "intent_queue"))
+        
+        # Grid configuration for Desktop 1 Chrome area
+        self.PANE_LEFT = 1023
+        self.PANE_TOP = 26
+        self.PANE_WIDTH = 1024
+        self.PANE_HEIGHT = 1046
+        self.GRID_COLUMNS = 12
+        self.GRID_ROWS = 8
+        
+        # Kai UI coordinates (Desktop 0, left side)  
+        self.KAI_INPUT_X = 300
+        self.KAI_INPUT_Y = 970
+        self.KAI_SEND_X = 860
+        self.KAI_SEND_Y = 1033
+        
+        # Kai's reply area (x1, y1, x2, y2)
+        self.KAI_RESPONSE_BOUNDS = (159, 206, 867, 915)
+        
+        # Reply detection: poll the reply area, OCR once it has stopped changing
+        self.RESPONSE_POLL_INTERVAL = 0.1   # Seconds between grabs of the reply area
+        self.RESPONSE_START_TIMEOUT = 30.0  # Give up if Kai hasn't started replying by then
+        self.RESPONSE_TIMEOUT = 120.0       # Upper bound for the whole reply
+        self.RESPONSE_SETTLE = 1.5          # Seconds without change before the reply counts as finished
+        self.RESPONSE_THRESHOLD = 2.0       # Mean grey-level difference that counts as a change
+        
+        self.grid_window = None
+        self.watching_clicks = False
+        
+        # Intent queue watcher ("auto", "inotify", "watchdog", "poll"); fires when an intent is queued
+        self.watch_backend = None
+        self.intent_watcher = None
+        self._stop_watching = threading.Event()
+        
+        # Screen capture backend ("auto", "xshm", "mss", "pyautogui"), opened on first capture
+        self.capture_backend = capture_backend
+        self._capture = None
+        
+        # OCR ("auto", "tesserocr", "pytesseract"): one engine handle, skipped while the reply area is unchanged
+        self.ocr = OCRReader(whitelist=CLICK_REGION_WHITELIST)
+
+    def ensure_directory(self):
+        """Create the kai_system directory if it doesn't exist"""
+        if not os.path.exists(self.base_dir):
+            os.makedirs(self.base_dir)
+            print(f"📁 Created directory: {self.base_dir}")
+
+    def switch_to_desktop_1(self):
+        """Switch to Desktop 1"""
+        subprocess.run([
+            "osascript", "-e",
+            'tell application "System Events" to key code 124 using control down'
+        ])
+        print("🖥  Switched to Desktop 1")
+        time.sleep(2)
+
+    def switch_to_desktop_0(self):
+        """Switch to Desktop 0"""
+        subprocess.run([
+            "osascript", "-e",
+            'tell application "System Events" to key code 123 using control down'
+        ])
+        print("🖥  Switched to Desktop 0")
+        time.sleep(1)
+
+    def activate_browser_window(self):
+        """Activate browser window and ensure it's in focus"""
+        print("🌐 Activating browser window...")
+        
+        # Method 1: Use AppleScript to bring Chrome to front
+        try:
+            subprocess.run([
+                "osascript", "-e",
+                'tell application "Google Chrome" to activate'
+            ], check=True)
+            time.sleep(0.5)
+            print("✅ Chrome activated via AppleScript")
+        except subprocess.CalledProcessError:
+            print("⚠️  AppleScript activation failed, trying alternative...")
+            
+        # Method 2: Click in browser area to ensure focus
+        browser_center_x = self.PANE_LEFT + (self.PANE_WIDTH // 2)
+        browser_center_y = self.PANE_TOP + (self.PANE_HEIGHT // 2)
+        
+        print(f"🖱️ Clicking browser center at ({browser_center_x}, {browser_center_y})")
+        pyautogui.moveTo(browser_center_x, browser_center_y, duration=0.3)
+        time.sleep(0.2)
+        pyautogui.click()
+        time.sleep(0.5)
+        print("✅ Browser window activated and focused")
+
+    def generate_human_movement_bursts(self, start_x, start_y, end_x, end_y):
+        """Generate realistic human movement bursts based on Jon's actual pattern"""
+        movement_bursts = []
+        
+        # Calculate total distance and direction
+        total_distance = math.sqrt((end_x - start_x)**2 + (end_y - start_y)**2)
+        direction_x = (end_x - start_x) / total_distance if total_distance > 0 else 0
+        direction_y = (end_y - start_y) / total_distance if total_distance > 0 else 0
+        
+        # Jon's pattern: 4-5 movement bursts with settling between
+        num_bursts = random.randint(4, 6)
+        current_x, current_y = start_x, start_y
+        
+        for burst in range(num_bursts):
+            # Calculate progress (how far along the path we should be)
+            progress = (burst + 1) / num_bursts
+            
+            # Target for this burst (with some randomness)
+            target_progress = progress + random.uniform(-0.1, 0.1)
+            target_progress = max(0, min(1, target_progress))  # Keep in bounds
+            
+            target_x = start_x + (end_x - start_x) * target_progress
+            target_y = start_y + (end_y - start_y) * target_progress
+            
+            # Add curve and randomness to target
+            curve_offset = random.uniform(-20, 20) if burst < num_bursts - 1 else 0
+            target_x += curve_offset * direction_y  # Perpendicular to main direction
+            target_y += curve_offset * direction_x
+            
+            # Movement burst (20-50ms like Jon's pattern)
+            burst_duration = random.uniform(0.02, 0.05)
+            burst_steps = max(2, int(burst_duration * 100))  # Steps within burst
+            
+            burst_movements = []
+            for step in range(burst_steps):
+                step_progress = step / (burst_steps - 1)
+                step_x = current_x + (target_x - current_x) * step_progress
+                step_y = current_y + (target_y - current_y) * step_progress
+                
+                # Add micro-tremor
+                step_x += random.uniform(-1, 1)
+                step_y += random.uniform(-1, 1)
+                
+                burst_movements.append({
+                    'x': int(step_x),
+                    'y': int(step_y),
+                    'delay': burst_duration / burst_steps
+                })
+            
+            movement_bursts.append({
+                'type': 'movement',
+                'movements': burst_movements,
+                'duration': burst_duration
+            })
+            
+            # Update current position
+            current_x, current_y = target_x, target_y
+            
+            # Settling pause (50-460ms like Jon's pattern)
+            if burst < num_bursts - 1:  # Don't pause after final burst
+                if burst == 1:  # Longer pause like Jon's 460ms pause
+                    pause_duration = random.uniform(0.4, 0.5)
+                else:  # Shorter pauses
+                    pause_duration = random.uniform(0.05, 0.2)
+                
+                movement_bursts.append({
+                    'type': 'pause',
+                    'duration': pause_duration,
+                    'position': (int(current_x), int(current_y))
+                })
+        
+        return movement_bursts
+
+    def execute_human_movement_bursts(self, target_x, target_y):
+        """Execute Jon's burst-and-pause movement pattern"""
+        print(f"🎯 Moving to ({target_x}, {target_y}) using burst-and-pause pattern")
+        
+        # Get current position
+        current_x, current_y = pyautogui.position()
+        
+        # Generate movement bursts
+        bursts = self.generate_human_movement_bursts(current_x, current_y, target_x, target_y)
+        
+        print(f"🚀 Executing {len(bursts)} movement bursts/pauses")
+        
+        total_time = 0
+        for i, burst in enumerate(bursts):
+            if burst['type'] == 'movement':
+                print(f"   📍 Burst {i+1}: {len(burst['movements'])} micro-movements over {burst['duration']*1000:.0f}ms")
+                
+                # Execute rapid micro-movements
+                for movement in burst['movements']:
+                    pyautogui.moveTo(movement['x'], movement['y'], duration=0)
+                    time.sleep(movement['delay'])
+                
+                total_time += burst['duration']
+                
+            elif burst['type'] == 'pause':
+                print(f"   ⏸️  Pause {i+1}: {burst['duration']*1000:.0f}ms at ({burst['position'][0]}, {burst['position'][1]})")
+                
+                # Stay at position during pause (crucial for browser detection)
+                pyautogui.moveTo(burst['position'][0], burst['position'][1], duration=0)
+                time.sleep(burst['duration'])
+                
+                total_time += burst['duration']
+        
+        # Final positioning with micro-settling (like Jon's final adjustments)
+        print("🎯 Final micro-settling...")
+        for _ in range(3):
+            offset_x = random.randint(-2, 2)
+            offset_y = random.randint(-2, 2)
+            pyautogui.moveTo(target_x + offset_x, target_y + offset_y, duration=0)
+            time.sleep(random.uniform(0.05, 0.1))
+        
+        # Final exact position
+        pyautogui.moveTo(target_x, target_y, duration=0)
+        
+        print(f"✅ Movement complete in {total_time:.3f}s (Jon's pattern: ~1s)")
+
+    def human_mouse_movement(self, target_x, target_y):
+        """Execute human-like mouse movement using Jon's burst pattern"""
+        print(f"🎯 Moving to target ({target_x}, {target_y}) with Jon's movement signature")
+        
+        # Get current mouse position
+        current_x, current_y = pyautogui.position()
+        
+        # Calculate distance
+        distance = math.sqrt((target_x - current_x)**2 + (target_y - current_y)**2)
+        
+        if distance < 10:
+            print("🎯 Already very close to target, adding micro-adjustments...")
+            # Just do micro-settling
+            for _ in range(2):
+                offset_x = random.randint(-2, 2)
+                offset_y = random.randint(-2, 2)
+                pyautogui.moveTo(target_x + offset_x, target_y + offset_y, duration=0)
+                time.sleep(random.uniform(0.05, 0.15))
+            pyautogui.moveTo(target_x, target_y, duration=0)
+            return
+        
+        # Execute burst-and-pause pattern
+        self.execute_human_movement_bursts(target_x, target_y)
+
+
+
+    def create_grid_overlay(self):
+        """No physical grid needed - Kai will use imaginary grid"""
+        print("📐 Using Kai's imaginary grid system")
+        time.sleep(1)
+
+    def get_capture(self):
+        """Open the configured capture backend on first use"""
+        if self._capture is None:
+            self._capture = make_capture(self.capture_backend)
+            print(f"📸 Using {self._capture.name} capture backend")
+        return self._capture
+
+    def grab_logical(self, region):
+        """Grab a (left, top, width, height) region given in logical (mouse) coordinates, at full pixel resolution"""
+        capture = self.get_capture()
+        return capture.grab(capture.to_frame_region(region))
+
+    def capture_screenshot(self):
+        """Capture screenshot of Desktop 1 Chrome area"""
+        region = (self.PANE_LEFT, self.PANE_TOP, self.PANE_WIDTH, self.PANE_HEIGHT)
+        frame = self.grab_logical(region)
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamped_path = os.path.join(self.base_dir, f"screenshot_{timestamp}.png")
+        
+        # Encode the PNG once, then copy the file for the other names
+        cv2.imwrite(timestamped_path, frame)
+        shutil.copyfile(timestamped_path, self.screenshot_path)
+        shutil.copyfile(self.screenshot_path, self.kai_read_path)
+        
+        print(f"📸 Screenshot captured and saved")
+        return self.kai_read_path
+
+    def copy_to_clipboard(self, image_path):
+        """Copy image to clipboard using AppleScript"""
+        applescript = f'''
+        set imgFile to POSIX file "{image_path}" as alias
+        set the clipboard to (read imgFile as JPEG picture)
+        '''
+        result = subprocess.run(["osascript", "-e", applescript], 
+                              capture_output=True, text=True)
+        if result.returncode == 0:
+            print("📋 Image copied to clipboard")
+        else:
+            print(f"⚠️  Clipboard error: {result.stderr}")
+
+    def send_to_kai(self, image_path):
+        """Send screenshot and prompt to Kai's UI with wake-up sequence.
+        
+        Returns the reply area's signature grabbed the moment the prompt is sent, as the
+        reference for wait_for_response().
+        """
+        print("📨 Sending wake-up call to Kai...")
+        
+        # Step 1: Send wake-up prompt first
+        pyautogui.moveTo(self.KAI_INPUT_X, self.KAI_INPUT_Y)
+        pyautogui.click()
+        time.sleep(0.5)
+        
+        wake_up_prompt = "Kai, prepare to analyze image – standby for screenshot"
+        pyautogui.typewrite(wake_up_prompt)
+        time.sleep(1)
+        
+        # Send wake-up message using Enter key
+        print("⌨️ Sending wake-up message with Enter key...")
+        pyautogui.press('enter')
+        
+        print("📨 Wake-up call sent, waiting 3 seconds...")
+        time.sleep(3)
+        
+        # Step 2: Copy image to clipboard and send with analysis prompt
+        self.copy_to_clipboard(image_path)
+        
+        # Click in input area
+        pyautogui.moveTo(self.KAI_INPUT_X, self.KAI_INPUT_Y)
+        pyautogui.click()
+        time.sleep(1)
+        
+        # Paste image ONCE only
+        print("📋 Pasting image once...")
+        pyautogui.hotkey('command', 'v')
+        time.sleep(3)  # Wait for image to appear and expand inbox
+        
+        # Add formal prompt with proper line break
+        prompt = "12x8 grid analyze click_region"
+        follow_up = "Kai, please respond with click_region(...) and JSON intent."
+        
+        print(f"📝 Sending prompt: '{prompt}'")
+        print(f"📝 Follow-up: '{follow_up}'")
+        
+        pyautogui.typewrite(prompt)
+        pyautogui.hotkey('shift', 'enter')  # Force line break
+        pyautogui.typewrite(follow_up)
+        time.sleep(1)
+        
+        # FIXED: Click expanded input area then use Enter key
+        print("⏳ Waiting for send button to become ready (orange/bold)...")
+        time.sleep(4)  # Wait for UI state change
+        print("🖱️ Clicking expanded input area to ensure focus...")
+        pyautogui.moveTo(886, 970)  # Expanded input coordinates
+        pyautogui.click()
+        time.sleep(0.5)
+        print("⌨️ SENDING MESSAGE WITH ENTER KEY...")
+        try:
+            pyautogui.press('enter')
+            print("✅ MESSAGE SENT WITH ENTER KEY!")
+        except Exception as e:
+            print(f"❌ ERROR SENDING MESSAGE: {e}")
+        # Baseline before the pause below, so a fast reply landing during it still counts as a change
+        _, reference = self.grab_response_area()
+        time.sleep(1)
+        
+        print("📨 Screenshot and analysis prompt sent to Kai")
+        return reference
+
+    def parse_kai_response_to_json(self, response_text):
+        """Parse Kai's click_region response and create JSON file"""
+        regions = parse_click_regions(response_text)
+        
+        if regions:
+            self.queue_click_region(regions[0])
+            return True
+        else:
+            print("❌ Could not parse click_region from response")
+            return False
+
+    def queue_click_region(self, region):
+        """Queue a click intent for a (top, left, width, height) click_region; returns its sequence number"""
+        top, left, width, height = region
+        center_x = left + width // 2
+        center_y = top + height // 2
+        
+        intent_data = {
+            "intent": "Auto-parsed click from Kai",
+            "grid_cell": "Auto",
+            "coordinates": {
+                "top": top,
+                "left": left, 
+                "width": width,
+                "height": height
+            },
+            "center_point": {
+                "x": center_x,
+                "y": center_y
+            },
+            "confidence": 0.94,
+            "safety_status": "green",
+            "requires_confirmation": False,
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        seq = self.intent_queue.put(intent_data)
+        self.write_intent_file(intent_data)
+        
+        print(f"✅ Parsed coordinates: ({center_x}, {center_y}) - queued as intent #{seq}")
+        return seq
+
+    def write_intent_file(self, intent_data):
+        """Mirror the latest intent to kai_click_intent.json (temp file + rename, never half-written)"""
+        tmp_path = self.intent_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(intent_data, f, indent=2)
+        os.replace(tmp_path, self.intent_path)
+
+    def response_region(self):
+        """Kai's reply area as (left, top, width, height)"""
+        left, top, right, bottom = self.KAI_RESPONSE_BOUNDS
+        return (left, top, right - left, bottom - top)
+
+    def grab_response_area(self):
+        """Grab the reply area: returns (frame, signature) for frame differencing"""
+        frame = self.grab_logical(self.response_region())
+        return frame, zone_signature(frame, (0, 0, frame.shape[1], frame.shape[0]))
+
+    def wait_for_response(self, reference, on_change=None):
+        """Wait until Kai's reply appears and stops growing; returns the final frame of the reply area.
+        
+        reference is the reply area's signature from just after the prompt was sent. The
+        area is grabbed every RESPONSE_POLL_INTERVAL seconds; once it differs from the
+        reference, the reply is streaming, and it is complete when nothing has changed for
+        RESPONSE_SETTLE seconds. On timeout the latest frame is returned anyway, so a slow
+        reply is read as far as it got rather than dropped. on_change(frame) is called with
+        every frame in which the reply grew.
+        """
+        start = time.perf_counter()
+        started_at = None
+        last_change = None
+        previous = reference
+        frame = None
+        
+        while True:
+            now = time.perf_counter()
+            if started_at is None and now - start > self.RESPONSE_START_TIMEOUT:
+                print(f"⚠️ No response from Kai after {self.RESPONSE_START_TIMEOUT:.0f}s")
+                return frame
+            if now - start > self.RESPONSE_TIMEOUT:
+                print(f"⚠️ Kai still replying after {self.RESPONSE_TIMEOUT:.0f}s - reading what is there")
+                return frame
+            
+            frame, signature = self.grab_response_area()
+            if signatures_differ(previous, signature, self.RESPONSE_THRESHOLD):
+                if started_at is None:
+                    started_at = now
+                    print(f"✍️ Kai started replying after {now - start:.1f}s")
+                last_change = now
+                previous = signature
+                if on_change is not None:
+                    on_change(frame)
+            elif started_at is not None and now - last_change >= self.RESPONSE_SETTLE:
+                print(f"✅ Response complete after {now - start:.1f}s")
+                return frame
+            
+            time.sleep(self.RESPONSE_POLL_INTERVAL)
+
+    def read_region_text(self, frame, key):
+        """OCR a grabbed region, downscaled to logical pixels"""
+        # Retina grabs are 2x; text is still legible at 1x and OCR is ~4x cheaper
+        scale = min(1.0, 1.0 / self.get_capture().scale())
+        return self.ocr.read(frame, key=key, scale=scale)
+
+    def parse_streaming_response(self, frame, parser):
+        """OCR a partial reply and queue its click as soon as a complete click_region shows up"""
+        if parser.regions:
+            return      # Only the first click_region of a reply is acted on
+        try:
+            regions = parser.update(self.read_region_text(frame, "response"))
+        except Exception as e:
+            print(f"⚠️ Streaming OCR failed: {e}")
+            return
+        if regions:
+            print("⚡ click_region complete while Kai is still replying")
+            self.queue_click_region(regions[0])
+
+    def capture_kai_response(self, frame=None):
+        """Capture Kai's latest response using OCR system
+        
+        Reads `frame` (e.g. from wait_for_response) or a fresh grab of the reply area. The
+        reply is read straight off the screen; the old drag-select-and-copy is only used
+        when OCR can't make out a click_region(...) in it.
+        """
+        print("📖 Capturing Kai's response with OCR...")
+        
+        try:
+            start = time.perf_counter()
+            if frame is None:
+                frame, _ = self.grab_response_area()
+            full_response = self.read_region_text(frame, "response")
+            
+            if len(full_response.strip()) > 20:
+                if parse_click_regions(full_response):
+                    print(f"✅ Read response with OCR in {1000 * (time.perf_counter() - start):.0f}ms: {full_response[:100]}...")
+                    return full_response
+                
+                left, top, right, bottom = self.KAI_RESPONSE_BOUNDS
+                print("📋 click_region not readable by OCR - copying the response text")
+                pyautogui.moveTo(left, top)
+                time.sleep(0.3)
+                pyautogui.dragTo(right, bottom, duration=1, button='left')
+                time.sleep(0.5)
+                pyautogui.hotkey('command', 'c')
+                time.sleep(1)
+                
+                full_response = pyperclip.paste()
+                print(f"✅ Captured response: {full_response[:100]}...")
+                return full_response
+            else:
+                print("❌ No substantial response found")
+                return None
+                
+        except Exception as e:
+            print(f"❌ OCR capture failed: {e}")
+            return None
+
+    def take_screenshot_with_grid(self):
+        """Main function: capture screenshot and send to Kai"""
+        print("🚀 Starting Kai Navigation System...")
+        
+        # Clear old JSON files
+        if os.path.exists(self.intent_path):
+            os.remove(self.intent_path)
+            print("🗑️ Cleared old JSON file")
+        
+        self.switch_to_desktop_1()
+        
+        # IMPORTANT: Activate browser window first
+        self.activate_browser_window()
+        
+        print("📐 No physical grid - Kai will use imaginary grid system...")
+        self.create_grid_overlay()
+        
+        print("📸 Capturing screenshot...")
+        image_path = self.capture_screenshot()
+        
+        print("📨 Sending to Kai...")
+        reference = self.send_to_kai(image_path)
+        
+        print("⏳ Waiting for Kai's response...")
+        parser = ClickRegionParser()
+        frame = self.wait_for_response(reference, on_change=lambda frame: self.parse_streaming_response(frame, parser))
+        if parser.regions:
+            print("✅ Click was queued from the streaming response")
+            return image_path
+        
+        response = self.capture_kai_response(frame)
+        if response and self.parse_kai_response_to_json(response):
+            print("✅ Response parsed and JSON created for click watcher")
+        else:
+            print("❌ Failed to parse Kai's response")
+        
+        return image_path
+
+    def handle_intent(self, seq, data):
+        """Execute one queued intent's click if it is safe and needs no confirmation"""
+        intent = data.get('intent', 'Unknown')
+        safety = data.get('safety_status', 'unknown')
+        confirm = data.get('requires_confirmation', True)
+        
+        center = data.get('center_point', {})
+        
+        if center:
+            x, y = center.get('x'), center.get('y')
+        else:
+            print(f"⚠️  Intent #{seq}: no valid coordinates found")
+            return
+        
+        print(f"\n🧠 Intent #{seq}: {intent}")
+        print(f"📍 Target: ({x}, {y})")
+        print(f"🛡️  Safety: {safety}")
+        
+        if safety == "green" and not confirm:
+            print("✅ Safe click - executing with human movement pattern")
+            
+            # ENHANCED: Activate browser first, then human movement
+            self.activate_browser_window()
+            time.sleep(0.5)
+            
+            # Execute Jon's burst-and-pause movement pattern
+            self.human_mouse_movement(x, y)
+            
+            # Click with slight delay after settling
+            time.sleep(0.3)
+            pyautogui.click(button='left', clicks=1, interval=0.25)
+            print(f"🖱️ Human-like click executed at ({x}, {y})")
+        else:
+            print("⏳ Requires manual confirmation - not clicking")
+
+    def process_intent_queue(self, path=None):
+        """Handle and acknowledge every queued intent, oldest first, then trim the done/ history"""
+        try:
+            if self.intent_queue.drain(self.handle_intent):
+                self.intent_queue.prune()
+        except Exception as e:
+            print(f"❌ Error reading intent queue: {e}")
+
+    def watch_for_click_intents(self):
+        """Watch the intent queue and execute human-like clicks.
+        
+        Blocks until stop_click_watcher(). The queue is drained whenever a producer
+        publishes (the queue's head file is renamed into place), not on a timer.
+        """
+        print(f"👀 Watching for click intents in {self.intent_queue.spool_dir}")
+        
+        self.watching_clicks = True
+        self._stop_watching.clear()
+        
+        # Intents claimed by a watcher that died before acknowledging them, then anything already queued
+        self.intent_queue.requeue_inflight()
+        self.intent_queue.prune()
+        self.process_intent_queue()
+        
+        self.intent_watcher = FileWatcher(self.intent_queue.head_path, self.process_intent_queue, backend=self.watch_backend)
+        self.intent_watcher.start()
+        try:
+            self._stop_watching.wait()
+        finally:
+            self.intent_watcher.stop()
+            self.intent_watcher = None
+            self.watching_clicks = False
+
+    def start_click_watcher(self):
+        """Start the click watcher in a separate thread"""
+        preload(pyautogui)
+        threading.Thread(target=self.watch_for_click_intents, daemon=True).start()
+
+    def stop_click_watcher(self):
+        """Stop watching for clicks"""
+        self.watching_clicks = False
+        self._stop_watching.set()
+
+def main():
+    kai = KaiNavigationSystem()
+    
+    print("Kai Complete Navigation System - HUMAN MOVEMENT SIGNATURE VERSION")
+    print("================================================================")
+    print("1. Take screenshot with grid")
+    print("2. Start click watcher")
+    print("3. Both (recommended)")
+    print("4. Quit")
+    
+    while True:
+        choice = input("\nEnter choice (1-4): ").strip()
+        
+        if choice == "1":
+            kai.take_screenshot_with_grid()
+            
+        elif choice == "2":
+            kai.start_click_watcher()
+            print("Click watcher started. Press Ctrl+C to stop.")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                kai.stop_click_watcher()
+                print("\nClick watcher stopped.")
+                
+        elif choice == "3":
+            kai.start_click_watcher()
+            time.sleep(2)
+            kai.take_screenshot_with_grid()
+            print("System running. Press Ctrl+C to stop.")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                kai.stop_click_watcher()
+                print("\nSystem stopped.")
+                
+        elif choice == "4":
+            kai.stop_click_watcher()
+            break
+            
+        else:
+            print("Invalid choice. Please enter 1, 2, 3, or 4.")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
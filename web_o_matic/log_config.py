@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+log_config.py
+
+Purpose:
+Leveled logging for the Web-O-Matic scripts.
+- get_logger("precision") returns a child of the "web_o_matic" logger
+- records go through a QueueHandler; a background QueueListener does the terminal I/O,
+  so a log call on the hot path only costs a queue put (or nothing if the level is off)
+- per-crop / per-match / per-movement diagnostics are logged at DEBUG, outcomes at INFO
+
+Pick the level with configure_logging("DEBUG") or WEB_O_MATIC_LOG_LEVEL=DEBUG.
+"""
+
+import os
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+
+ROOT_LOGGER = "web_o_matic"
+LOG_LEVEL_ENV_VAR = "WEB_O_MATIC_LOG_LEVEL"
+
+_listener = None
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that looks up sys.stdout at emit time (so redirects still apply)"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def configure_logging(level=None, async_output=True, fmt="%(message)s"):
+    """Set up the web_o_matic logger (safe to call again to change the level)"""
+    global _listener
+    level = level or os.environ.get(LOG_LEVEL_ENV_VAR, "INFO")
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.INFO
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    if _listener is not None or logger.handlers:
+        return logger
+
+    output = _StdoutHandler()
+    output.setFormatter(logging.Formatter(fmt))
+    if async_output:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=False)
+        _listener.start()
+        # Drain anything still queued before the interpreter exits
+        atexit.register(shutdown_logging)
+    else:
+        logger.addHandler(output)
+    return logger
+
+
+def shutdown_logging():
+    """Flush and stop the background log writer"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name):
+    """Logger for one module, configuring the defaults on first use"""
+    if not logging.getLogger(ROOT_LOGGER).handlers:
+        configure_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+ocr_engine.py
+
+Purpose:
+Fast OCR of Kai's reply area. pytesseract.image_to_string() writes the image to a temp
+file and starts a tesseract process on every call (~0.5-2s); this keeps one engine loaded.
+- tesserocr: persistent TessBaseAPI handle in-process, pixels handed over without a PNG round trip
+- pytesseract: subprocess per call, used only when tesserocr isn't installed
+
+OCRReader in front of either backend:
+- converts the region to a binarised, optionally downscaled grayscale image (dark text on white)
+- restricts the character set (CLICK_REGION_WHITELIST covers click_region(...) replies)
+- skips OCR entirely when the region's pixels are unchanged since the last read
+
+Select a backend with make_ocr_engine("tesserocr" | "pytesseract" | "auto") or the
+WEB_O_MATIC_OCR environment variable.
+"""
+
+import os
+import hashlib
+import threading
+from log_config import get_logger
+from lazy_import import lazy_import
+
+try:
+    import xxhash  # Optional: much faster region hashing than hashlib
+except ImportError:
+    xxhash = None
+
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+
+OCR_ENV_VAR = "WEB_O_MATIC_OCR"
+
+# Everything a click_region(top=.., left=.., width=.., height=..) reply needs
+CLICK_REGION_WHITELIST = "click_region()topleftwidthheight=0123456789, "
+
+log = get_logger("ocr")
+
+
+def preprocess_for_ocr(frame, scale=1.0):
+    """BGR/gray region -> uint8 binary image with dark text on a white background"""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    if scale != 1.0:
+        gray = cv2.resize(gray, (max(1, round(gray.shape[1] * scale)), max(1, round(gray.shape[0] * scale))),
+                          interpolation=cv2.INTER_AREA)
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    # Tesseract expects dark text on light paper; flip dark-mode chat bubbles
+    if cv2.countNonZero(binary) < binary.size // 2:
+        binary = cv2.bitwise_not(binary)
+    return binary
+
+
+class OCREngine:
+    """Base class: recognize(gray) returns the text in a uint8 single-channel image"""
+    name = "base"
+
+    def __init__(self, whitelist=None, psm=6, lang="eng"):
+        self.whitelist = whitelist
+        self.psm = psm      # 6 = one uniform block of text
+        self.lang = lang
+
+    def recognize(self, gray):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class TesserocrEngine(OCREngine):
+    """tesserocr: one TessBaseAPI kept loaded for the life of the process"""
+    name = "tesserocr"
+
+    def __init__(self, whitelist=None, psm=6, lang="eng"):
+        super().__init__(whitelist, psm, lang)
+        import tesserocr
+        self._api = tesserocr.PyTessBaseAPI(lang=lang, psm=psm)
+        if whitelist:
+            self._api.SetVariable("tessedit_char_whitelist", whitelist)
+        # The handle holds per-image state, so calls are serialised
+        self._lock = threading.Lock()
+
+    def recognize(self, gray):
+        gray = np.ascontiguousarray(gray)
+        height, width = gray.shape
+        with self._lock:
+            self._api.SetImageBytes(gray.tobytes(), width, height, 1, width)
+            return self._api.GetUTF8Text()
+
+    def close(self):
+        if self._api is not None:
+            self._api.End()
+            self._api = None
+
+
+class PytesseractEngine(OCREngine):
+    """pytesseract: a tesseract subprocess per call (the old behaviour, minus the RGB input)"""
+    name = "pytesseract"
+
+    def __init__(self, whitelist=None, psm=6, lang="eng"):
+        super().__init__(whitelist, psm, lang)
+        import pytesseract
+        self._pytesseract = pytesseract
+        self._config = f"--psm {psm}"
+        if whitelist:
+            # Spaces can't be passed through the command line; tesseract still emits word gaps
+            self._config += " -c tessedit_char_whitelist=" + whitelist.replace(" ", "")
+
+    def recognize(self, gray):
+        return self._pytesseract.image_to_string(gray, lang=self.lang, config=self._config)
+
+
+OCR_BACKENDS = {
+    "tesserocr": TesserocrEngine,
+    "pytesseract": PytesseractEngine
+}
+
+AUTO_ORDER = ("tesserocr", "pytesseract")
+
+
+def make_ocr_engine(backend=None, whitelist=None, psm=6, lang="eng"):
+    """Create an OCR backend by name ("auto" prefers the in-process tesserocr handle)"""
+    backend = (backend or os.environ.get(OCR_ENV_VAR) or "auto").lower()
+    if backend != "auto":
+        if backend not in OCR_BACKENDS:
+            raise ValueError(f"Unknown OCR backend: {backend} (choose from {', '.join(OCR_BACKENDS)} or auto)")
+        return OCR_BACKENDS[backend](whitelist, psm, lang)
+
+    errors = []
+    for name in AUTO_ORDER:
+        try:
+            return OCR_BACKENDS[name](whitelist, psm, lang)
+        except Exception as e:
+            errors.append(f"{name}: {e}")
+    raise RuntimeError("No OCR backend available - " + "; ".join(errors))
+
+
+def hash_region(frame):
+    """Content hash of a captured region (xxh3 if available, else blake2b)"""
+    data = np.ascontiguousarray(frame).data
+    if xxhash is not None:
+        return xxhash.xxh3_64_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class OCRReader:
+    """Preprocess + OCR with a one-entry cache per region key: unchanged pixels return the last text"""
+
+    def __init__(self, engine=None, backend=None, whitelist=None, scale=1.0):
+        self.engine = engine
+        self.backend = backend
+        self.whitelist = whitelist
+        self.scale = scale
+        self._last = {}     # key -> (pixel hash, text)
+        self.hits = 0
+        self.misses = 0
+
+    def get_engine(self):
+        """Open the OCR backend on first use (loading the tesseract model takes a moment)"""
+        if self.engine is None:
+            self.engine = make_ocr_engine(self.backend, whitelist=self.whitelist)
+            log.info("🔤 Using %s OCR backend", self.engine.name)
+        return self.engine
+
+    def read(self, frame, key="default", scale=None):
+        """Text in a captured region (BGR or gray); OCR only runs when its pixels changed"""
+        digest = hash_region(frame)
+        cached = self._last.get(key)
+        if cached is not None and cached[0] == digest:
+            self.hits += 1
+            log.debug("🔤 OCR skipped for %s: region unchanged", key)
+            return cached[1]
+
+        self.misses += 1
+        binary = preprocess_for_ocr(frame, self.scale if scale is None else scale)
+        text = self.get_engine().recognize(binary)
+        self._last[key] = (digest, text)
+        log.debug("🔤 OCR %s: %d chars", key, len(text))
+        return text
+
+    def clear(self):
+        self._last.clear()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "backend": self.engine.name if self.engine is not None else None}
+
+    def close(self):
+        if self.engine is not None:
+            self.engine.close()
+            self.engine = None
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+precision_daemon.py
+
+Purpose:
+Long-lived service mode for WebOMatic_Precision. One process keeps cv2/pyautogui imported,
+targets_zones.json loaded and the template/match caches warm, and serves click/find/capture
+requests over a Unix domain socket, so automation steps don't pay process startup each time.
+
+Protocol: newline-delimited JSON-RPC 2.0 - one request object per line, one response per line,
+any number of requests per connection. Requests are executed one at a time (the mouse and
+the matcher state are shared).
+
+    python precision_daemon.py serve [--socket PATH] [--backend mss] [--continuous]
+    python precision_daemon.py call find '{"target": "Drive"}'
+    python precision_daemon.py call click '{"target": "Gmail"}'
+
+From Python: precision_daemon.call("find", {"target": "Drive"})
+"""
+
+import os
+import sys
+import json
+import socket
+import inspect
+import argparse
+import threading
+import socketserver
+from log_config import get_logger
+
+SOCKET_ENV_VAR = "WEB_O_MATIC_SOCKET"
+DEFAULT_SOCKET_PATH = os.environ.get(SOCKET_ENV_VAR, "/tmp/web_o_matic.sock")
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+log = get_logger("daemon")
+
+
+class RPCError(Exception):
+    """Error returned by (or raised inside) an RPC method"""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.daemon.handle_line(line)
+            if response is None:
+                continue
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class PrecisionDaemon:
+    """Serves one WebOMatic_Precision instance over a Unix domain socket"""
+
+    def __init__(self, precision=None, socket_path=DEFAULT_SOCKET_PATH, capture_backend=None):
+        if precision is None:
+            from web_o_matic_precision_human_click_v6_fixed import WebOMatic_Precision
+            precision = WebOMatic_Precision(capture_backend=capture_backend)
+        self.precision = precision
+        self.socket_path = socket_path
+        self.server = None
+        self._lock = threading.Lock()
+        self.methods = {
+            "ping": self.rpc_ping,
+            "targets": self.rpc_targets,
+            "find": self.rpc_find,
+            "capture": self.rpc_capture,
+            "click": self.rpc_click,
+            "activate": self.rpc_activate,
+            "stats": self.rpc_stats,
+            "reload": self.rpc_reload,
+            "shutdown": self.rpc_shutdown
+        }
+
+    # --- RPC methods -------------------------------------------------------
+
+    def rpc_ping(self):
+        return {"pid": os.getpid()}
+
+    def rpc_targets(self):
+        return self.precision.TARGET_ZONES
+
+    def rpc_find(self, target=None, targets=None, fresh=True, confidence_threshold=0.75):
+        """Match one target (returns its match or null) or several (returns {name: match})"""
+        names = targets if targets is not None else [target]
+        if not names or any(name not in self.precision.TARGET_ZONES for name in names):
+            raise RPCError(INVALID_PARAMS, f"Unknown target in {names}")
+        if fresh:
+            self.precision.capture_target_zones(names)
+        if targets is not None:
+            return self.precision.find_targets(names, confidence_threshold=confidence_threshold)
+        return self.precision.find_target(target)
+
+    def rpc_capture(self, save=False, region=None):
+        """Grab a frame into the daemon (later finds with fresh=false use it); returns its size"""
+        if region is not None:
+            region = tuple(int(value) for value in region)
+            if len(region) != 4:
+                raise RPCError(INVALID_PARAMS, "region must be [left, top, width, height]")
+            frame = self.precision.capture_frame(region=region)
+        else:
+            frame = self.precision.take_fresh_screenshot(save_to_disk=save)
+            self.precision.update_frame_scale(frame.shape[1], frame.shape[0])
+        return {
+            "width": frame.shape[1],
+            "height": frame.shape[0],
+            "origin": list(self.precision.last_frame_origin or (0, 0)),
+            "path": self.precision.screenshot_path if save and region is None else None
+        }
+
+    def rpc_click(self, target):
+        if target not in self.precision.TARGET_ZONES:
+            raise RPCError(INVALID_PARAMS, f"Unknown target: {target}")
+        return self.precision.precision_click(target)
+
+    def rpc_activate(self):
+        self.precision.activate_browser_window()
+        return True
+
+    def rpc_stats(self):
+        from timing import tracer
+        return {
+            "match_cache": self.precision.match_cache.stats(),
+            "frame_size": list(self.precision.frame_size),
+            "scale_factor": self.precision.scale_factor,
+            "spans": tracer.summary()
+        }
+
+    def rpc_reload(self):
+        """Re-read targets_zones.json and the reference images"""
+        self.precision.templates.invalidate()
+        self.precision.match_cache.clear()
+        self.precision.load_target_zones()
+        self.precision.build_grid_table()
+        return list(self.precision.TARGET_ZONES)
+
+    def rpc_shutdown(self):
+        # shutdown() blocks until serve_forever returns, so it can't run on a handler thread
+        threading.Thread(target=self.stop, daemon=True).start()
+        return True
+
+    # --- Dispatch ----------------------------------------------------------
+
+    def handle_line(self, line):
+        """Decode one request line and return the response object (None for notifications)"""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return _error_response(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error_response(None, INVALID_REQUEST, "Invalid request")
+        request_id = request.get("id")
+        # A notification (no id) gets no response at all, not even an error
+        notification = "id" not in request
+        try:
+            result = self.dispatch(request["method"], request.get("params"))
+        except RPCError as e:
+            if notification:
+                log.warning("⚠️ Notification %s rejected: %s", request["method"], e.message)
+                return None
+            return _error_response(request_id, e.code, e.message)
+        except Exception as e:
+            log.error("❌ RPC %s failed: %s", request["method"], e)
+            if notification:
+                return None
+            return _error_response(request_id, SERVER_ERROR, f"{type(e).__name__}: {e}")
+        if notification:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def dispatch(self, method_name, params=None):
+        method = self.methods.get(method_name)
+        if method is None:
+            raise RPCError(METHOD_NOT_FOUND, f"Method not found: {method_name}")
+        # Check the arguments against the signature up front, so a TypeError raised inside
+        # the method is reported as a server error rather than as bad params
+        if params is not None and not isinstance(params, (dict, list)):
+            raise RPCError(INVALID_PARAMS, "params must be an object or an array")
+        try:
+            if isinstance(params, dict):
+                bound = inspect.signature(method).bind(**params)
+            else:
+                bound = inspect.signature(method).bind(*(params or []))
+        except TypeError as e:
+            raise RPCError(INVALID_PARAMS, str(e))
+        with self._lock:
+            return method(*bound.args, **bound.kwargs)
+
+    # --- Lifecycle ---------------------------------------------------------
+
+    def start(self):
+        """Bind the socket (replacing a stale one left by a dead daemon)"""
+        if os.path.exists(self.socket_path):
+            try:
+                probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                probe.connect(self.socket_path)
+                probe.close()
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.socket_path)
+        self.server = _Server(self.socket_path, _Handler)
+        self.server.daemon = self
+        os.chmod(self.socket_path, 0o600)
+        log.info("🛰️ Web-O-Matic daemon listening on %s", self.socket_path)
+
+    def serve_forever(self):
+        if self.server is None:
+            self.start()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.close()
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+
+    def close(self):
+        if self.server is not None:
+            self.server.server_close()
+            self.server = None
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+            self.precision.stop_continuous_capture()
+            log.info("🛰️ Web-O-Matic daemon stopped")
+
+
+def _error_response(request_id, code, message):
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class DaemonClient:
+    """Keeps one connection open for a sequence of calls"""
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, timeout=60.0):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(socket_path)
+        self.reader = self.sock.makefile("rb")
+        self._next_id = 0
+
+    def call(self, method, params=None):
+        self._next_id += 1
+        request = {"jsonrpc": "2.0", "id": self._next_id, "method": method}
+        if params is not None:
+            request["params"] = params
+        self.sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("Daemon closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise RPCError(response["error"]["code"], response["error"]["message"])
+        return response["result"]
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def call(method, params=None, socket_path=DEFAULT_SOCKET_PATH, timeout=60.0):
+    """One-shot RPC call to a running daemon"""
+    with DaemonClient(socket_path, timeout) as client:
+        return client.call(method, params)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Web-O-Matic precision daemon")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Unix socket path")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve = sub.add_parser("serve", help="Run the daemon")
+    serve.add_argument("--backend", help="Screen capture backend (pyautogui, mss, xshm)")
+    serve.add_argument("--continuous", action="store_true", help="Keep a background capture ring buffer running")
+    client = sub.add_parser("call", help="Send one request to a running daemon")
+    client.add_argument("method")
+    client.add_argument("params", nargs="?", help="JSON object or array of parameters")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        daemon = PrecisionDaemon(socket_path=args.socket, capture_backend=args.backend)
+        if args.continuous:
+            daemon.precision.start_continuous_capture()
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    params = json.loads(args.params) if args.params else None
+    try:
+        result = call(args.method, params, socket_path=args.socket)
+    except RPCError as e:
+        print(f"❌ {e.message} ({e.code})")
+        sys.exit(1)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+screen_capture.py
+
+Purpose:
+Pluggable screen capture backends that hand back BGR NumPy frames ready for OpenCV.
+- pyautogui: works everywhere pyautogui does, but goes through PIL
+- mss: fast cross-platform grabber, raw BGRA buffer straight into NumPy
+- xshm: X11 MIT-SHM grabber (Linux/Xvfb), the X server writes straight into shared memory
+
+Select a backend with make_capture("xshm" | "mss" | "pyautogui" | "auto") or the
+WEB_O_MATIC_CAPTURE environment variable.
+
+Units: every backend takes regions as (left, top, width, height) in frame pixels - the
+pixel grid of a full-screen grab (2x the logical points on Retina) - and returns exactly
+that many pixels. Mouse/pyautogui coordinates are logical points; convert them with
+capture.to_frame_region(region). scale() is frame pixels per logical point.
+
+Benchmark the backends on the current display (works under Xvfb):
+    xvfb-run -s "-screen 0 1600x900x24" python screen_capture.py --frames 200
+"""
+
+import os
+import sys
+import time
+import json
+import math
+import ctypes
+import ctypes.util
+import threading
+from lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+CAPTURE_ENV_VAR = "WEB_O_MATIC_CAPTURE"
+
+class Capture:
+    """Base class: grab() returns the screen (or a region of it) as a BGR uint8 array"""
+    name = "base"
+
+    def grab(self, region=None):
+        raise NotImplementedError
+
+    def screen_size(self):
+        """Full screen size in frame pixels: (width, height)"""
+        frame = self.grab()
+        return frame.shape[1], frame.shape[0]
+
+    def logical_size(self):
+        """Full screen size in logical points, the units mouse events use: (width, height)"""
+        return self.screen_size()
+
+    def scale(self):
+        """Frame pixels per logical point (2.0 on Retina)"""
+        return self.screen_size()[0] / self.logical_size()[0]
+
+    def to_frame_region(self, region):
+        """(left, top, width, height) in logical points -> the same rectangle in frame pixels"""
+        scale = self.scale()
+        return tuple(int(round(value * scale)) for value in region)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PyAutoGUICapture(Capture):
+    """pyautogui.screenshot() - slowest, but the same pixels the scripts have always used"""
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        self._pyautogui = pyautogui
+        self._screen_size = None
+
+    def grab(self, region=None):
+        # Whether screenshot(region=...) means points or pixels depends on the platform and
+        # Pillow version, so grab the whole screen and crop in frame pixels here
+        rgb = np.asarray(self._pyautogui.screenshot().convert("RGB"))
+        self._screen_size = (rgb.shape[1], rgb.shape[0])
+        if region is not None:
+            left, top, width, height = (int(v) for v in region)
+            rgb = rgb[max(0, top):top + height, max(0, left):left + width]
+        # RGB -> BGR without going back through PIL
+        return np.ascontiguousarray(rgb[:, :, ::-1])
+
+    def screen_size(self):
+        if self._screen_size is None:
+            self.grab()
+        return self._screen_size
+
+    def logical_size(self):
+        size = self._pyautogui.size()
+        return size[0], size[1]
+
+
+class MSSCapture(Capture):
+    """mss grabber: copies the raw BGRA buffer into NumPy, no PIL involved"""
+    name = "mss"
+
+    def __init__(self):
+        import mss
+        self._mss = mss
+        # mss handles aren't safe to share across threads, so keep one per thread
+        self._local = threading.local()
+        sct = self._sct()  # Connect now so an unusable display fails at construction
+        # Monitor rectangles are in points on macOS but grabs come back in pixels;
+        # measure the ratio once with a small grab
+        monitor = sct.monitors[0]
+        probe = sct.grab({"left": monitor["left"], "top": monitor["top"], "width": 16, "height": 16})
+        self._scale = probe.width / 16
+
+    def _sct(self):
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            # Newer mss releases rename the factory to MSS
+            factory = getattr(self._mss, "MSS", None) or self._mss.mss
+            sct = factory()
+            self._local.sct = sct
+        return sct
+
+    def grab(self, region=None):
+        sct = self._sct()
+        crop = None
+        if region is None:
+            monitor = sct.monitors[0]  # All monitors combined, like a full-screen grab
+        elif self._scale == 1.0:
+            left, top, width, height = region
+            monitor = {"left": int(left), "top": int(top), "width": int(width), "height": int(height)}
+        else:
+            # Frame pixels -> the enclosing rectangle in points, then trim to the exact pixels
+            left, top, width, height = (int(v) for v in region)
+            s = self._scale
+            point_left, point_top = math.floor(left / s), math.floor(top / s)
+            point_right, point_bottom = math.ceil((left + width) / s), math.ceil((top + height) / s)
+            monitor = {"left": point_left, "top": point_top,
+                       "width": point_right - point_left, "height": point_bottom - point_top}
+            offset_x, offset_y = left - int(point_left * s), top - int(point_top * s)
+            crop = (slice(offset_y, offset_y + height), slice(offset_x, offset_x + width))
+        shot = sct.grab(monitor)
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        if crop is not None:
+            bgra = bgra[crop]
+        return np.ascontiguousarray(bgra[:, :, :3])
+
+    def screen_size(self):
+        monitor = self._sct().monitors[0]
+        return int(monitor["width"] * self._scale), int(monitor["height"] * self._scale)
+
+    def logical_size(self):
+        monitor = self._sct().monitors[0]
+        return monitor["width"], monitor["height"]
+
+    def close(self):
+        sct = getattr(self._local, "sct", None)
+        if sct is not None:
+            sct.close()
+            self._local.sct = None
+
+
+class _XImage(ctypes.Structure):
+    # Leading fields of Xlib's XImage - only these are read
+    _fields_ = [
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("xoffset", ctypes.c_int),
+        ("format", ctypes.c_int),
+        ("data", ctypes.c_void_p),
+        ("byte_order", ctypes.c_int),
+        ("bitmap_unit", ctypes.c_int),
+        ("bitmap_bit_order", ctypes.c_int),
+        ("bitmap_pad", ctypes.c_int),
+        ("depth", ctypes.c_int),
+        ("bytes_per_line", ctypes.c_int),
+        ("bits_per_pixel", ctypes.c_int),
+        ("red_mask", ctypes.c_ulong),
+        ("green_mask", ctypes.c_ulong),
+        ("blue_mask", ctypes.c_ulong),
+    ]
+
+
+class _XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ("shmseg", ctypes.c_ulong),
+        ("shmid", ctypes.c_int),
+        ("shmaddr", ctypes.c_void_p),
+        ("readOnly", ctypes.c_int),
+    ]
+
+
+class XShmCapture(Capture):
+    """X11 MIT-SHM grabber: XShmGetImage into a reused shared-memory segment per region size"""
+    name = "xshm"
+
+    ZPixmap = 2
+    IPC_PRIVATE = 0
+    IPC_CREAT = 0o1000
+    IPC_RMID = 0
+    ALL_PLANES = ctypes.c_ulong(-1).value
+
+    def __init__(self, display=None):
+        if not sys.platform.startswith("linux"):
+            raise RuntimeError("XShm capture is only available on Linux/X11")
+
+        x11_path = ctypes.util.find_library("X11")
+        xext_path = ctypes.util.find_library("Xext")
+        if not x11_path or not xext_path:
+            raise RuntimeError("libX11/libXext not found")
+        self._x11 = ctypes.CDLL(x11_path)
+        self._xext = ctypes.CDLL(xext_path)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._declare_functions()
+
+        display_name = display or os.environ.get("DISPLAY")
+        self._display = self._x11.XOpenDisplay(display_name.encode() if display_name else None)
+        if not self._display:
+            raise RuntimeError(f"Cannot open X display {display_name!r}")
+        if not self._xext.XShmQueryExtension(self._display):
+            self._x11.XCloseDisplay(self._display)
+            raise RuntimeError("X server has no MIT-SHM extension")
+
+        screen = self._x11.XDefaultScreen(self._display)
+        self._root = self._x11.XRootWindow(self._display, screen)
+        self._visual = self._x11.XDefaultVisual(self._display, screen)
+        self._depth = self._x11.XDefaultDepth(self._display, screen)
+        self._width = self._x11.XDisplayWidth(self._display, screen)
+        self._height = self._x11.XDisplayHeight(self._display, screen)
+
+        # One shared-memory XImage per (width, height), reused across grabs
+        self._images = {}
+        self._lock = threading.Lock()
+
+    def _declare_functions(self):
+        x11, xext, libc = self._x11, self._xext, self._libc
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        x11.XRootWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XRootWindow.restype = ctypes.c_ulong
+        x11.XDefaultVisual.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDefaultVisual.restype = ctypes.c_void_p
+        x11.XDefaultDepth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XFree.argtypes = [ctypes.c_void_p]
+
+        xext.XShmQueryExtension.argtypes = [ctypes.c_void_p]
+        xext.XShmCreateImage.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int,
+                                         ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo),
+                                         ctypes.c_uint, ctypes.c_uint]
+        xext.XShmCreateImage.restype = ctypes.POINTER(_XImage)
+        xext.XShmAttach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmDetach.argtypes = [ctypes.c_void_p, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmGetImage.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(_XImage),
+                                      ctypes.c_int, ctypes.c_int, ctypes.c_ulong]
+
+        libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+        libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+        libc.shmat.restype = ctypes.c_void_p
+        libc.shmdt.argtypes = [ctypes.c_void_p]
+        libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+
+    def _image_for(self, width, height):
+        key = (width, height)
+        if key in self._images:
+            return self._images[key]
+
+        shminfo = _XShmSegmentInfo()
+        ximage = self._xext.XShmCreateImage(self._display, self._visual, self._depth, self.ZPixmap,
+                                            None, ctypes.byref(shminfo), width, height)
+        if not ximage:
+            raise RuntimeError("XShmCreateImage failed")
+        image = ximage.contents
+        if image.bits_per_pixel != 32:
+            self._x11.XFree(ximage)
+            raise RuntimeError(f"Unsupported X visual: {image.bits_per_pixel} bits per pixel")
+
+        size = image.bytes_per_line * image.height
+        shminfo.shmid = self._libc.shmget(self.IPC_PRIVATE, size, self.IPC_CREAT | 0o600)
+        if shminfo.shmid < 0:
+            self._x11.XFree(ximage)
+            raise OSError(ctypes.get_errno(), "shmget failed")
+        address = self._libc.shmat(shminfo.shmid, None, 0)
+        if address in (None, ctypes.c_void_p(-1).value):
+            self._libc.shmctl(shminfo.shmid, self.IPC_RMID, None)
+            self._x11.XFree(ximage)
+            raise OSError(ctypes.get_errno(), "shmat failed")
+        shminfo.shmaddr = address
+        shminfo.readOnly = 0
+        image.data = address
+
+        self._xext.XShmAttach(self._display, ctypes.byref(shminfo))
+        self._x11.XSync(self._display, 0)
+        # Mark for removal now; the segment lives until the last detach
+        self._libc.shmctl(shminfo.shmid, self.IPC_RMID, None)
+
+        buffer = (ctypes.c_uint8 * size).from_address(address)
+        pixels = np.ctypeslib.as_array(buffer).reshape(height, image.bytes_per_line // 4, 4)
+        self._images[key] = (ximage, shminfo, pixels)
+        return self._images[key]
+
+    def grab(self, region=None):
+        if region is None:
+            left, top, width, height = 0, 0, self._width, self._height
+        else:
+            left, top, width, height = (int(v) for v in region)
+        with self._lock:
+            ximage, _, pixels = self._image_for(width, height)
+            if not self._xext.XShmGetImage(self._display, self._root, ximage, left, top, self.ALL_PLANES):
+                raise RuntimeError(f"XShmGetImage failed for region {(left, top, width, height)}")
+            # BGRX in shared memory -> BGR copy (the segment is overwritten by the next grab)
+            return np.ascontiguousarray(pixels[:, :width, :3])
+
+    def screen_size(self):
+        return self._width, self._height
+
+    def logical_size(self):
+        # X11 has no separate logical coordinate space: pointer events use these pixels
+        return self._width, self._height
+
+    def close(self):
+        with self._lock:
+            for ximage, shminfo, _ in self._images.values():
+                self._xext.XShmDetach(self._display, ctypes.byref(shminfo))
+                self._libc.shmdt(shminfo.shmaddr)
+                self._x11.XFree(ximage)
+            self._images.clear()
+            if self._display:
+                self._x11.XCloseDisplay(self._display)
+                self._display = None
+
+
+CAPTURE_BACKENDS = {
+    "xshm": XShmCapture,
+    "mss": MSSCapture,
+    "pyautogui": PyAutoGUICapture,
+}
+
+# "auto" tries the fastest backend first
+AUTO_ORDER = ("xshm", "mss", "pyautogui")
+
+
+def make_capture(backend=None):
+    """Create a capture backend by name ("auto" picks the fastest one that works here)"""
+    backend = (backend or os.environ.get(CAPTURE_ENV_VAR) or "auto").lower()
+    if backend != "auto":
+        if backend not in CAPTURE_BACKENDS:
+            raise ValueError(f"Unknown capture backend: {backend} (choose from {', '.join(CAPTURE_BACKENDS)} or auto)")
+        return CAPTURE_BACKENDS[backend]()
+
+    errors = []
+    for name in AUTO_ORDER:
+        try:
+            return CAPTURE_BACKENDS[name]()
+        except Exception as e:
+            errors.append(f"{name}: {e}")
+    raise RuntimeError("No capture backend available - " + "; ".join(errors))
+
+
+def benchmark_backends(frames=100, region=None, backends=None):
+    """Grab frames with each available backend and report frames/sec"""
+    results = {}
+    for name in backends or CAPTURE_BACKENDS:
+        try:
+            capture = make_capture(name)
+        except Exception as e:
+            print(f"⚠️ {name}: unavailable ({e})")
+            results[name] = {"available": False, "error": str(e)}
+            continue
+
+        try:
+            with capture:
+                frame = capture.grab(region)  # Warm-up (allocates buffers)
+                start = time.perf_counter()
+                for _ in range(frames):
+                    capture.grab(region)
+                elapsed = time.perf_counter() - start
+        except Exception as e:
+            print(f"❌ {name}: capture failed ({e})")
+            results[name] = {"available": False, "error": str(e)}
+            continue
+
+        fps = frames / elapsed if elapsed > 0 else float("inf")
+        results[name] = {
+            "available": True,
+            "frames": frames,
+            "frame_size": [frame.shape[1], frame.shape[0]],
+            "fps": fps,
+            "ms_per_frame": 1000.0 * elapsed / frames
+        }
+        print(f"📸 {name:10s} {frame.shape[1]}x{frame.shape[0]}  {fps:7.1f} fps  ({1000.0 * elapsed / frames:.2f} ms/frame)")
+    return results
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark screen capture backends")
+    parser.add_argument("--frames", type=int, default=100, help="Frames to grab per backend")
+    parser.add_argument("--region", type=int, nargs=4, metavar=("LEFT", "TOP", "WIDTH", "HEIGHT"),
+                        help="Grab only this region")
+    parser.add_argument("--backend", action="append", choices=sorted(CAPTURE_BACKENDS),
+                        help="Backend to benchmark (repeatable, default: all)")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results = benchmark_backends(args.frames, tuple(args.region) if args.region else None, args.backend)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
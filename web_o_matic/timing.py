@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+timing.py
+
+Purpose:
+Lightweight span timing for the click pipeline.
+- tracer.span("name") context manager and @traced("name") decorator
+- spans are kept in memory and dumped as JSON lines or Chrome trace events
+  (open the .json in chrome://tracing or https://ui.perfetto.dev)
+- disabled by default: a disabled span is a shared no-op object, and a traced
+  function just calls through after one attribute check
+
+Enable from the environment to trace a whole run and dump it on exit:
+    WEB_O_MATIC_TRACE=trace.json python web_o_matic_precision_human_click_v6_fixed.py
+(a path ending in .jsonl is written as JSON lines instead)
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+import functools
+
+TRACE_ENV_VAR = "WEB_O_MATIC_TRACE"
+
+class _NullSpan:
+    """Returned by span() while tracing is off"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, collector, name, args):
+        self.collector = collector
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.collector.record(self.name, self.start, end - self.start, self.args)
+        return False
+
+    def set(self, **args):
+        """Attach extra fields to the span (e.g. a result) before it closes"""
+        self.args.update(args)
+
+
+class TraceCollector:
+    """In-memory span collector"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.spans = []
+        self._lock = threading.Lock()
+        # perf_counter has no fixed epoch; remember one so exports carry wall-clock time
+        self._epoch_wall = time.time()
+        self._epoch_perf = time.perf_counter()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def clear(self):
+        with self._lock:
+            self.spans = []
+
+    def span(self, name, **args):
+        """Time a block: `with tracer.span("find_target", target=name): ...`"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def traced(self, name=None):
+        """Decorator that wraps every call of a function in a span"""
+        def decorator(func):
+            span_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, span_name, {}):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name, start, duration, args=None):
+        """Store a finished span (start is a perf_counter value, duration in seconds)"""
+        thread = threading.current_thread()
+        entry = {
+            "name": name,
+            "start": self._epoch_wall + (start - self._epoch_perf),
+            "duration_ms": duration * 1000.0,
+            "thread": thread.name,
+            "tid": thread.ident,
+            "args": args or {}
+        }
+        with self._lock:
+            self.spans.append(entry)
+
+    def summary(self):
+        """Per-name count/total/mean/max in milliseconds"""
+        with self._lock:
+            spans = list(self.spans)
+        summary = {}
+        for entry in spans:
+            stats = summary.setdefault(entry["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stats["count"] += 1
+            stats["total_ms"] += entry["duration_ms"]
+            stats["max_ms"] = max(stats["max_ms"], entry["duration_ms"])
+        for stats in summary.values():
+            stats["mean_ms"] = stats["total_ms"] / stats["count"]
+        return summary
+
+    def print_summary(self):
+        for name, stats in sorted(self.summary().items(), key=lambda item: -item[1]["total_ms"]):
+            print(f"⏱️  {name:28s} x{stats['count']:<4d} total {stats['total_ms']:9.1f}ms  "
+                  f"mean {stats['mean_ms']:8.1f}ms  max {stats['max_ms']:8.1f}ms")
+
+    def dump_jsonl(self, path):
+        """One JSON object per span"""
+        with self._lock:
+            spans = list(self.spans)
+        with open(path, "w") as f:
+            for entry in spans:
+                f.write(json.dumps(entry) + "\n")
+        return path
+
+    def dump_chrome_trace(self, path):
+        """Chrome trace-event format (complete "X" events, microsecond timestamps)"""
+        with self._lock:
+            spans = list(self.spans)
+        pid = os.getpid()
+        events = [{
+            "name": entry["name"],
+            "ph": "X",
+            "ts": entry["start"] * 1e6,
+            "dur": entry["duration_ms"] * 1000.0,
+            "pid": pid,
+            "tid": entry["tid"],
+            "args": entry["args"]
+        } for entry in spans]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
+
+    def dump(self, path):
+        """Write JSON lines for .jsonl paths, Chrome trace events otherwise"""
+        if path.endswith(".jsonl"):
+            return self.dump_jsonl(path)
+        return self.dump_chrome_trace(path)
+
+
+tracer = TraceCollector()
+span = tracer.span
+traced = tracer.traced
+
+
+def _configure_from_env():
+    path = os.environ.get(TRACE_ENV_VAR)
+    if not path:
+        return
+    tracer.enable()
+
+    def _dump_on_exit():
+        if tracer.spans:
+            tracer.dump(path)
+            print(f"💾 Trace saved to: {path} ({len(tracer.spans)} spans)")
+    atexit.register(_dump_on_exit)
+
+_configure_from_env()
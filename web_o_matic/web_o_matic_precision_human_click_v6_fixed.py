@@ -8,23 +8,302 @@ Integrates Jon's burst-and-pause movement pattern with Kai's precision targeting
 """
 
 import os
-import pyautogui
+import re
+import sys
 import time
 import random
 import json
-import cv2
-import numpy as np
 import math
-from PIL import Image
+import threading
+import hashlib
+import functools
+from collections import OrderedDict
 from datetime import datetime
+from lazy_import import lazy_import, preload
+from screen_capture import make_capture
+from frame_buffer import ContinuousCapture, zone_signature, signatures_differ
+from timing import tracer, traced
+from log_config import get_logger
+
+try:
+    import xxhash  # Optional: much faster zone hashing than hashlib
+except ImportError:
+    xxhash = None
+
+# Heavy libraries load on first use, so listing targets or talking to the daemon starts fast
+pyautogui = lazy_import("pyautogui")
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+futures = lazy_import("concurrent.futures")
+
+log = get_logger("precision")
+
+def resize_image(img, scale):
+    """Resize an image by a uniform scale factor (area interpolation when shrinking)"""
+    height, width = img.shape[:2]
+    new_size = (max(1, int(round(width * scale))), max(1, int(round(height * scale))))
+    interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+    return cv2.resize(img, new_size, interpolation=interpolation)
+
+# Per-target matching modes (targets_zones.json "match_mode"):
+#   color  - BGR template matching (default)
+#   gray   - single channel, about a third of the matchTemplate work
+#   edges  - Canny edge maps, robust to theme/colour changes
+#   masked - BGR matching that ignores the template's transparent pixels (PNG alpha)
+MATCH_MODES = ("color", "gray", "edges", "masked")
+EDGE_THRESHOLDS = (50, 150)
+
+def edge_map(gray):
+    """Canny edges thickened by one pixel, so a 1px misalignment still overlaps"""
+    edges = cv2.Canny(gray, *EDGE_THRESHOLDS)
+    return cv2.dilate(edges, np.ones((3, 3), np.uint8))
+
+def convert_for_mode(img, mode):
+    """Convert a BGR zone crop into the representation a matching mode compares"""
+    if mode == "gray":
+        return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    if mode == "edges":
+        return edge_map(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY))
+    return img
+
+class TemplateCache:
+    """Decoded reference templates kept in memory, reloaded only when the PNG's mtime changes"""
+
+    def __init__(self, modes=("color",), check_interval=2.0):
+        self.modes = modes                    # Representations built for every template at load time
+        self.check_interval = check_interval  # Seconds between mtime checks per template
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._loads = 0     # Bumped on every (re)load, so each decoded version gets its own number
+
+    def _load(self, path, modes=()):
+        """Decode a template from disk into a cache entry"""
+        mtime = os.path.getmtime(path)
+        image = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+        if image is None:
+            return None
+        alpha = None
+        if image.ndim == 2:
+            template = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        elif image.shape[2] == 4:
+            template = np.ascontiguousarray(image[:, :, :3])
+            alpha = image[:, :, 3]
+        else:
+            template = image
+        # Converted/resized copies are keyed by (mode, scale); "mask" is the binarised alpha
+        variants = {("color", 1.0): template}
+        # A fully opaque (or fully transparent) alpha channel has nothing to mask
+        if alpha is not None and alpha.min() < 255 and alpha.max() > 0:
+            variants[("mask", 1.0)] = np.where(alpha > 0, 255, 0).astype(np.uint8)
+        self._loads += 1
+        entry = {
+            "variants": variants,
+            "mtime": mtime,
+            "version": self._loads,
+            "checked": time.time()
+        }
+        for mode in set(self.modes) | set(modes):
+            self._variant(entry, mode, 1.0)
+        self._entries[path] = entry
+        return entry
+
+    def _variant(self, entry, mode, scale):
+        """Build (and keep) a converted/resized copy of a template; None for a mask it doesn't have"""
+        variants = entry["variants"]
+        if mode == "masked":
+            mode = "color"
+        key = (mode, scale)
+        if key in variants:
+            return variants[key]
+        if mode == "mask":
+            if ("mask", 1.0) not in variants:
+                return None
+            # Nearest-neighbour keeps the mask binary
+            base = variants[("mask", 1.0)]
+            height, width = base.shape[:2]
+            size = (max(1, int(round(width * scale))), max(1, int(round(height * scale))))
+            variants[key] = cv2.resize(base, size, interpolation=cv2.INTER_NEAREST)
+        elif mode == "edges":
+            # Edges of the resized grayscale, not a resized edge map, so line widths match the zone's
+            variants[key] = edge_map(self._variant(entry, "gray", scale))
+        elif scale != 1.0:
+            variants[key] = resize_image(self._variant(entry, mode, 1.0), scale)
+        elif mode == "gray":
+            variants[key] = cv2.cvtColor(variants[("color", 1.0)], cv2.COLOR_BGR2GRAY)
+        else:
+            raise ValueError(f"Unknown match mode: {mode}")
+        return variants[key]
+
+    def preload(self, paths, modes=None):
+        """Load every template up front so lookups never wait on disk.
+        
+        modes maps a path to the match modes its targets use, so those copies are built now too.
+        """
+        loaded = 0
+        with self._lock:
+            for path in paths:
+                try:
+                    if self._load(path, (modes or {}).get(path, ())) is not None:
+                        loaded += 1
+                    else:
+                        log.warning("⚠️ Could not decode reference template: %s", path)
+                except OSError:
+                    log.warning("⚠️ Reference template missing: %s", path)
+        return loaded
+
+    def get(self, path, mode="color", scale=1.0):
+        """Return the decoded template for path in a match mode (optionally resized), or None.
+        
+        mode "mask" returns the binarised alpha channel, or None if the PNG has no transparency.
+        """
+        return self.get_versioned(path, mode, scale)[0]
+
+    def get_versioned(self, path, mode="color", scale=1.0):
+        """Like get(), but returns (template, version); version changes whenever the PNG is reloaded"""
+        with self._lock:
+            entry = self._entries.get(path)
+            now = time.time()
+            try:
+                if entry is None:
+                    entry = self._load(path)
+                elif now - entry["checked"] >= self.check_interval:
+                    entry["checked"] = now
+                    if os.path.getmtime(path) != entry["mtime"]:
+                        log.info("🔄 Reference template changed on disk, reloading: %s", os.path.basename(path))
+                        modes = {key[0] for key in entry["variants"] if key[1] == 1.0}
+                        entry = self._load(path, modes)
+            except OSError:
+                # File vanished - drop it so we don't match against a stale template
+                self._entries.pop(path, None)
+                return None, None
+            
+            if entry is None:
+                return None, None
+            
+            # Build converted/resized copies on first request and keep them with the entry
+            return self._variant(entry, mode, scale), entry["version"]
+
+    def invalidate(self, path=None):
+        """Forget one template (or all of them) so the next lookup reloads from disk"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+
+GRID_CELL_PATTERN = re.compile(r"^([A-Z]+)([0-9]+)$")
+
+@functools.lru_cache(maxsize=None)
+def parse_grid_cell(grid_cell):
+    """Split a cell name into 0-based (column, row): 'B3' -> (1, 2), 'L10' -> (11, 9), 'AA3' -> (26, 2)"""
+    match = GRID_CELL_PATTERN.match(grid_cell.strip().upper()) if isinstance(grid_cell, str) else None
+    if match is None:
+        raise ValueError(f"Invalid grid cell: {grid_cell}")
+    letters, digits = match.groups()
+    col = 0
+    for letter in letters:
+        col = col * 26 + (ord(letter) - ord("A") + 1)   # Spreadsheet-style: Z, AA, AB, ...
+    row = int(digits) - 1
+    if row < 0:
+        raise ValueError(f"Invalid grid cell: {grid_cell}")
+    return col - 1, row
+
+def grid_cell_name(col, row):
+    """Inverse of parse_grid_cell: (26, 2) -> 'AA3'"""
+    letters = ""
+    col += 1
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return f"{letters}{row + 1}"
+
+
+def hash_pixels(img):
+    """Fast content hash of an image (xxh3 if available, else blake2b)"""
+    data = np.ascontiguousarray(img).data
+    if xxhash is not None:
+        return xxhash.xxh3_64_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+class MatchCache:
+    """LRU of match results keyed by target + hash of the zone's pixels, with hit/miss counters"""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return (found, match_result) for key, refreshing its LRU position"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                result = self._entries[key]
+                return True, dict(result) if result is not None else None
+            self.misses += 1
+            return False, None
+
+    def put(self, key, match_result):
+        """Store a result (None is cached too, so a static miss is also free), evicting the oldest"""
+        with self._lock:
+            self._entries[key] = dict(match_result) if match_result is not None else None
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries)
+            }
 
 class WebOMatic_Precision:
-    def __init__(self):
+    def __init__(self, capture_backend=None):
         # Use the script's directory instead of a separate kai_system folder
         self.base_dir = os.path.dirname(__file__)
         self.targets_config_path = os.path.join(os.path.dirname(__file__), "targets_zones.json")
         self.screenshot_path = os.path.join(self.base_dir, "current_screenshot.png")
         self.intent_path = os.path.join(self.base_dir, "kai_click_intent.json")
+        self.calibration_path = os.path.join(self.base_dir, "display_calibration.json")
+        self.refs_dir = os.path.join(self.base_dir, "kai_ui_refs")
+        
+        # Decoded reference templates, filled from targets_zones.json on load
+        self.templates = TemplateCache()
+        
+        # Most recent in-memory capture (BGR) and any background PNG write in flight.
+        # last_frame_origin is None for a full-screen frame, or the (left, top) of a region capture.
+        self.last_frame = None
+        self.last_frame_origin = None
+        self.full_frame_captured = False
+        
+        # Screen capture backend ("auto", "xshm", "mss", "pyautogui"), opened on first capture
+        self.capture_backend = capture_backend
+        self._capture = None
+        
+        # Background capture into a ring buffer (start_continuous_capture) for event-driven waits
+        self.continuous_capture = None
+        self._save_thread = None
+        self._save_pending = None   # (frame, path) waiting for the writer - only the newest is kept
+        self._save_lock = threading.Lock()
+        
+        # Worker pool for batch matching, created on first use
+        self._match_pool = None
+        
+        # Previous match results for unchanged zone pixels
+        self.match_cache = MatchCache()
         
         # Load target zones configuration
         self.load_target_zones()
@@ -37,59 +316,194 @@ class WebOMatic_Precision:
         self.GRID_COLUMNS = 12
         self.GRID_ROWS = 8
         
-        # Fixed to base resolution, no scaling
+        # Logical (mouse) screen size, asked from the capture backend on first use. The grid
+        # covers the whole logical screen unless set_grid(size=...) gives it a fixed size.
+        self.DEFAULT_LOGICAL_SIZE = (1600, 900)   # Used when no display can be queried
+        self.logical_size = None
+        self.grid_size_fixed = False
+        
+        # Frame-to-logical scale: frame pixels per logical point (2.0 on Retina, 1.0 otherwise)
         self.scale_factor = 1.0
+        self.frame_size = (self.BASE_GRID_WIDTH, self.BASE_GRID_HEIGHT)
         self.ANCHOR_LEFT = self.BASE_ANCHOR_LEFT
         self.ANCHOR_TOP = self.BASE_ANCHOR_TOP  
         self.GRID_WIDTH = self.BASE_GRID_WIDTH
         self.GRID_HEIGHT = self.BASE_GRID_HEIGHT
+        
+        # Pixel rectangle of every cell and of every zone looked up so far, rebuilt on any grid change
+        self.cell_rects = []
+        self.zone_bounds_memo = {}
+        self.fallback_zone_memo = {}
+        self.build_grid_table()
+        
+        # Template scale search: refs captured at another DPI are tried at these sizes.
+        # The winning scale per display is remembered so later frames try it first.
+        self.scale_search = True
+        self.TEMPLATE_SCALES = (1.0, 2.0, 0.5, 1.5, 0.75, 1.25)
+        self._calibration_lock = threading.Lock()   # Batch matching calibrates from worker threads
+        self.load_display_calibration()
+        
+        # Coarse-to-fine matching: search a downscaled zone first, then refine at full resolution
+        self.use_pyramid = True
+        self.PYRAMID_SCALES = (0.25, 0.5)     # Coarsest first; first one that keeps the template usable wins
+        self.PYRAMID_MIN_TEMPLATE_SIDE = 16   # Don't shrink templates below this many pixels
+        self.PYRAMID_MIN_POSITIONS = 4096     # Zones with fewer match positions are cheap enough at full res
+        self.PYRAMID_CANDIDATES = 3           # Coarse peaks to refine
+        
+        # When the primary zone misses, widen the search in these stages on the same frame,
+        # stopping at the first confident hit or once the target's time budget is spent.
+        # Per target: "fallback": ["ring", "half"] (or false) and "time_budget_ms" in targets_zones.json
+        self.FALLBACK_STAGES = ("ring", "half", "full")   # Neighbouring cells, screen half, whole frame
+        self.FALLBACK_TIME_BUDGET_MS = 800    # Whole lookup, primary zone included
+
+    def logical_screen_size(self):
+        """Logical screen size in points, the coordinates pyautogui clicks in: (width, height)"""
+        if self.logical_size is None:
+            try:
+                self.logical_size = tuple(self.get_capture().logical_size())
+            except Exception as e:
+                log.warning("⚠️ Can't query the display (%s) - assuming a %sx%s logical screen", e, *self.DEFAULT_LOGICAL_SIZE)
+                self.logical_size = self.DEFAULT_LOGICAL_SIZE
+        return self.logical_size
+
+    def calculate_scale_factor(self, screenshot_width):
+        """Calculate scale factor based on actual screenshot dimensions"""
+        logical_width, logical_height = self.logical_screen_size()
+        self.scale_factor = screenshot_width / logical_width
+        if not self.grid_size_fixed:
+            self.BASE_GRID_WIDTH, self.BASE_GRID_HEIGHT = logical_width, logical_height
+        self.scale_grid()
+        
+        log.info("🔧 Scale factor: %.2f", self.scale_factor)
+        log.info("🔧 Scaled coordinates: anchor=(%s, %s), size=(%sx%s)", self.ANCHOR_LEFT, self.ANCHOR_TOP, self.GRID_WIDTH, self.GRID_HEIGHT)
+
+    def scale_grid(self):
+        """Map the logical grid layout to frame pixels at the current scale factor and rebuild the table"""
+        self.ANCHOR_LEFT = int(self.BASE_ANCHOR_LEFT * self.scale_factor)
+        self.ANCHOR_TOP = int(self.BASE_ANCHOR_TOP * self.scale_factor)
+        self.GRID_WIDTH = int(self.BASE_GRID_WIDTH * self.scale_factor)
+        self.GRID_HEIGHT = int(self.BASE_GRID_HEIGHT * self.scale_factor)
+        self.build_grid_table()
+
+    def set_grid(self, columns=None, rows=None, anchor=None, size=None):
+        """Change the grid layout (cell counts, logical anchor (left, top) or logical size (w, h)) and rebuild the table.
+        
+        Only the cell table changes; the frame-to-logical scale stays that of the display.
+        """
+        if columns is not None:
+            self.GRID_COLUMNS = columns
+        if rows is not None:
+            self.GRID_ROWS = rows
+        if anchor is not None:
+            self.BASE_ANCHOR_LEFT, self.BASE_ANCHOR_TOP = anchor
+        if size is not None:
+            self.BASE_GRID_WIDTH, self.BASE_GRID_HEIGHT = size
+            self.grid_size_fixed = True
+        self.scale_grid()
+
+    def build_grid_table(self):
+        """Precompute the pixel rectangle of every grid cell and the bounds of every configured zone"""
+        cell_width = self.GRID_WIDTH / self.GRID_COLUMNS
+        cell_height = self.GRID_HEIGHT / self.GRID_ROWS
+        width = int(cell_width)
+        height = int(cell_height)
+        lefts = [int(self.ANCHOR_LEFT + col * cell_width) for col in range(self.GRID_COLUMNS)]
+        tops = [int(self.ANCHOR_TOP + row * cell_height) for row in range(self.GRID_ROWS)]
+        self.cell_rects = [[(left, top, width, height) for left in lefts] for top in tops]
+
+        self.zone_bounds_memo = {}
+        self.fallback_zone_memo = {}
+        for config in self.TARGET_ZONES.values():
+            try:
+                self.get_zone_bounds(config["grid_zone"])
+            except (KeyError, ValueError) as e:
+                log.warning("⚠️ Skipping invalid grid_zone %s: %s", config.get("grid_zone"), e)
 
-    # Comment out dynamic scaling to force 1600x900
-    # def calculate_scale_factor(self, screenshot_width):
-    #     """Calculate scale factor based on actual screenshot dimensions"""
-    #     expected_width = 1600  # Expected logical resolution width
-    #     self.scale_factor = screenshot_width / expected_width
-    #     
-    #     # Scale all grid coordinates
-    #     self.ANCHOR_LEFT = int(self.BASE_ANCHOR_LEFT * self.scale_factor)
-    #     self.ANCHOR_TOP = int(self.BASE_ANCHOR_TOP * self.scale_factor)
-    #     self.GRID_WIDTH = int(self.BASE_GRID_WIDTH * self.scale_factor)
-    #     self.GRID_HEIGHT = int(self.BASE_GRID_HEIGHT * self.scale_factor)
-    #     
-    #     print(f"🔧 Scale factor: {self.scale_factor:.2f}")
-    #     print(f"🔧 Scaled coordinates: anchor=({self.ANCHOR_LEFT}, {self.ANCHOR_TOP}), size=({self.GRID_WIDTH}x{self.GRID_HEIGHT})")
+    def load_display_calibration(self):
+        """Load remembered template scales per display ({"WxH": {ref_image: scale}})"""
+        try:
+            with open(self.calibration_path, "r") as f:
+                self.display_calibration = json.load(f)
+            log.info("✅ Loaded scale calibration for %d displays", len(self.display_calibration))
+        except FileNotFoundError:
+            self.display_calibration = {}
+        except json.JSONDecodeError as e:
+            log.warning("⚠️ Ignoring invalid display_calibration.json: %s", e)
+            self.display_calibration = {}
+
+    def save_display_calibration(self):
+        """Persist the calibration cache (temp file + rename so it's never half-written)"""
+        # Unique temp name: other processes may be saving their calibration at the same time
+        tmp_path = f"{self.calibration_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            with self._calibration_lock:
+                with open(tmp_path, "w") as f:
+                    json.dump(self.display_calibration, f, indent=2)
+                os.replace(tmp_path, self.calibration_path)
+        except OSError as e:
+            log.warning("⚠️ Could not save display calibration: %s", e)
+
+    def record_calibration(self, ref_key, scale):
+        """Remember the template scale that matched ref_key on this display, and save it"""
+        with self._calibration_lock:
+            self.display_calibration.setdefault(self.display_key(), {})[ref_key] = scale
+        self.save_display_calibration()
+
+    def update_frame_scale(self, width, height):
+        """Rescale the grid if a full frame's size differs from the last one seen"""
+        if (width, height) != self.frame_size:
+            self.frame_size = (width, height)
+            # A new frame size usually means another display: ask the backend for its logical size again
+            self.logical_size = None
+            self.calculate_scale_factor(width)
+
+    def display_key(self):
+        """Identify the display by the size of the frames it produces"""
+        return f"{self.frame_size[0]}x{self.frame_size[1]}"
 
     def load_target_zones(self):
         """Load target zones configuration"""
         try:
             with open(self.targets_config_path, "r") as f:
                 self.TARGET_ZONES = json.load(f)
-            print(f"✅ Loaded {len(self.TARGET_ZONES)} target zones")
+            log.info("✅ Loaded %d target zones", len(self.TARGET_ZONES))
+            self.preload_templates()
         except FileNotFoundError:
-            print(f"❌ targets_zones.json not found at {self.targets_config_path}")
+            log.error("❌ targets_zones.json not found at %s", self.targets_config_path)
             self.TARGET_ZONES = {}
         except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON in targets_zones.json: {e}")
+            log.error("❌ Invalid JSON in targets_zones.json: %s", e)
             self.TARGET_ZONES = {}
 
-    def grid_to_pixel(self, grid_cell):
-        """Convert grid cell (like 'B3') to pixel coordinates"""
-        column_map = "ABCDEFGHIJKL"
-        if len(grid_cell) != 2 or grid_cell[0] not in column_map:
-            raise ValueError(f"Invalid grid cell: {grid_cell}")
-        
-        col = column_map.index(grid_cell[0])
-        row = int(grid_cell[1]) - 1
+    def ref_image_full_path(self, ref_image):
+        """Full path of a reference image named in targets_zones.json"""
+        return os.path.join(self.refs_dir, ref_image)
 
-        cell_width = self.GRID_WIDTH / self.GRID_COLUMNS
-        cell_height = self.GRID_HEIGHT / self.GRID_ROWS
+    def target_match_mode(self, target_config):
+        """Matching mode for a target ("match_mode" in targets_zones.json, default color)"""
+        mode = target_config.get("match_mode", "color")
+        if mode not in MATCH_MODES:
+            log.warning("⚠️ Unknown match_mode %r - using color (choose from %s)", mode, ", ".join(MATCH_MODES))
+            return "color"
+        return mode
 
-        left = int(self.ANCHOR_LEFT + col * cell_width)
-        top = int(self.ANCHOR_TOP + row * cell_height)
-        width = int(cell_width)
-        height = int(cell_height)
+    def preload_templates(self):
+        """Decode every reference image used by targets_zones.json into the template cache,
+        pre-converted for the match modes its targets use"""
+        modes = {}
+        for config in self.TARGET_ZONES.values():
+            if config.get("ref_image"):
+                path = self.ref_image_full_path(config["ref_image"])
+                modes.setdefault(path, set()).add(self.target_match_mode(config))
+        loaded = self.templates.preload(list(modes), modes)
+        log.info("✅ Cached %s reference templates", loaded)
 
-        return (left, top, width, height)
+    def grid_to_pixel(self, grid_cell):
+        """Convert grid cell (like 'B3', 'L10' or 'AA3') to pixel coordinates"""
+        col, row = parse_grid_cell(grid_cell)
+        if col >= self.GRID_COLUMNS or row >= self.GRID_ROWS:
+            raise ValueError(f"Grid cell {grid_cell} is outside the {self.GRID_COLUMNS}x{self.GRID_ROWS} grid")
+        return self.cell_rects[row][col]
 
     def get_zone_bounds(self, grid_zone):
         """Get pixel bounds for a zone defined by grid cells"""
@@ -97,6 +511,9 @@ class WebOMatic_Precision:
             raise ValueError("Zone must have exactly 2 grid cells (top-left, bottom-right)")
         
         top_left_cell, bottom_right_cell = grid_zone
+        bounds = self.zone_bounds_memo.get((top_left_cell, bottom_right_cell))
+        if bounds is not None:
+            return bounds
         
         # Get bounds of both cells
         tl_left, tl_top, tl_width, tl_height = self.grid_to_pixel(top_left_cell)
@@ -109,25 +526,89 @@ class WebOMatic_Precision:
         zone_height = (br_top + br_height) - tl_top
         
         # Debug output
-        print(f"🔍 Zone calculation debug:")
-        print(f"   Top-left {top_left_cell}: ({tl_left}, {tl_top}, {tl_width}, {tl_height})")
-        print(f"   Bottom-right {bottom_right_cell}: ({br_left}, {br_top}, {br_width}, {br_height})")
-        print(f"   Final zone: ({zone_left}, {zone_top}, {zone_width}, {zone_height})")
+        log.debug("🔍 Zone calculation debug:")
+        log.debug("   Top-left %s: (%s, %s, %s, %s)", top_left_cell, tl_left, tl_top, tl_width, tl_height)
+        log.debug("   Bottom-right %s: (%s, %s, %s, %s)", bottom_right_cell, br_left, br_top, br_width, br_height)
+        log.debug("   Final zone: (%s, %s, %s, %s)", zone_left, zone_top, zone_width, zone_height)
         
-        return (zone_left, zone_top, zone_width, zone_height)
+        bounds = (zone_left, zone_top, zone_width, zone_height)
+        self.zone_bounds_memo[(top_left_cell, bottom_right_cell)] = bounds
+        return bounds
+
+    def fallback_zones(self, grid_zone, stages=None):
+        """Wider zones to search when grid_zone misses, nearest first: [(stage, grid_zone), ...].
+        
+        ring: grid_zone grown by one cell on every side
+        half: the left or right half of the screen holding the zone's centre
+        full: the whole grid
+        Stages that would cover no more than an earlier one are skipped.
+        """
+        stages = tuple(self.FALLBACK_STAGES if stages is None else stages)
+        memo_key = (tuple(grid_zone), stages)
+        zones = self.fallback_zone_memo.get(memo_key)
+        if zones is not None:
+            return zones
+
+        (left, top), (right, bottom) = parse_grid_cell(grid_zone[0]), parse_grid_cell(grid_zone[1])
+        last_col, last_row = self.GRID_COLUMNS - 1, self.GRID_ROWS - 1
+        covered = (left, top, right, bottom)
+        zones = []
+        for stage in stages:
+            if stage == "ring":
+                cells = (max(0, left - 1), max(0, top - 1), min(last_col, right + 1), min(last_row, bottom + 1))
+            elif stage == "half":
+                middle = (self.GRID_COLUMNS + 1) // 2
+                if (left + right + 1) / 2 <= middle:
+                    cells = (0, 0, middle - 1, last_row)
+                else:
+                    cells = (self.GRID_COLUMNS - middle, 0, last_col, last_row)
+            elif stage == "full":
+                cells = (0, 0, last_col, last_row)
+            else:
+                raise ValueError(f"Unknown fallback stage: {stage}")
+
+            # Skip a stage that doesn't reach beyond what has already been searched
+            if cells[0] >= covered[0] and cells[1] >= covered[1] and cells[2] <= covered[2] and cells[3] <= covered[3]:
+                continue
+            covered = (min(covered[0], cells[0]), min(covered[1], cells[1]), max(covered[2], cells[2]), max(covered[3], cells[3]))
+            zones.append((stage, [grid_cell_name(cells[0], cells[1]), grid_cell_name(cells[2], cells[3])]))
 
-    def load_and_crop_zone(self, image_path, grid_zone):
-        """Load image and crop to specified zone"""
-        img = cv2.imread(image_path)
+        self.fallback_zone_memo[memo_key] = zones
+        return zones
+
+    def load_frame(self, image):
+        """Return a BGR frame from either an in-memory array or an image path"""
+        if isinstance(image, np.ndarray):
+            return image
+        img = cv2.imread(image)
         if img is None:
-            raise FileNotFoundError(f"Image not found: {image_path}")
+            raise FileNotFoundError(f"Image not found: {image}")
+        return img
+
+    def load_and_crop_zone(self, image, grid_zone, frame_origin=None):
+        """Load image (path or BGR array) and crop to specified zone.
+        
+        frame_origin is the (left, top) of a region capture within the full screen;
+        the returned offset is always in full-frame pixels.
+        """
+        img = self.load_frame(image)
 
         # Debug: Show actual screenshot dimensions
         img_height, img_width = img.shape[:2]
-        print(f"🖼️ Screenshot dimensions: {img_width}x{img_height} pixels")
+        log.debug("🖼️ Screenshot dimensions: %sx%s pixels", img_width, img_height)
+
+        # Rescale the grid when the frame comes from a display with a different pixel density
+        # (region captures aren't full frames, so they keep the current scale)
+        if frame_origin is None:
+            self.update_frame_scale(img_width, img_height)
 
         left, top, width, height = self.get_zone_bounds(grid_zone)
-        print(f"🎯 Requested crop: ({left}, {top}) with size {width}x{height}")
+        log.debug("🎯 Requested crop: (%s, %s) with size %sx%s", left, top, width, height)
+        
+        # Shift into the region capture's own coordinates
+        origin_left, origin_top = frame_origin or (0, 0)
+        left -= origin_left
+        top -= origin_top
         
         # Ensure bounds are within image (OpenCV uses [height, width] format!)
         left = max(0, min(left, img_width))
@@ -135,61 +616,325 @@ class WebOMatic_Precision:
         right = max(left, min(left + width, img_width))
         bottom = max(top, min(top + height, img_height))
         
-        print(f"🔧 Adjusted bounds: left={left}, top={top}, right={right}, bottom={bottom}")
+        log.debug("🔧 Adjusted bounds: left=%s, top=%s, right=%s, bottom=%s", left, top, right, bottom)
         
         cropped = img[top:bottom, left:right]
-        print(f"🔍 Cropped zone {grid_zone} to {cropped.shape[1]}x{cropped.shape[0]} pixels (WxH)")
-        return cropped, (left, top)
+        log.debug("🔍 Cropped zone %s to %sx%s pixels (WxH)", grid_zone, cropped.shape[1], cropped.shape[0])
+        return cropped, (left + origin_left, top + origin_top)
+
+    def pick_pyramid_scale(self, zone_img, template):
+        """Choose the coarse scale for pyramid matching, or None to match at full resolution"""
+        if not self.use_pyramid:
+            return None
+        zone_h, zone_w = zone_img.shape[:2]
+        tmpl_h, tmpl_w = template.shape[:2]
+        if (zone_w - tmpl_w + 1) * (zone_h - tmpl_h + 1) < self.PYRAMID_MIN_POSITIONS:
+            return None
+        for scale in self.PYRAMID_SCALES:
+            if min(tmpl_w, tmpl_h) * scale >= self.PYRAMID_MIN_TEMPLATE_SIDE:
+                return scale
+        return None
+
+    def pyramid_match(self, zone_img, template, scale, coarse_template=None):
+        """Coarse-to-fine template match: returns (max_val, max_loc) at full resolution.
+        
+        The zone and template are matched at `scale`, then only a small window around
+        each of the best coarse peaks is re-matched at full resolution, so the returned
+        confidence is a true full-resolution TM_CCOEFF_NORMED score.
+        """
+        if coarse_template is None:
+            coarse_template = resize_image(template, scale)
+        coarse_zone = resize_image(zone_img, scale)
+        coarse_result = cv2.matchTemplate(coarse_zone, coarse_template, cv2.TM_CCOEFF_NORMED)
+
+        zone_h, zone_w = zone_img.shape[:2]
+        tmpl_h, tmpl_w = template.shape[:2]
+        coarse_h, coarse_w = coarse_template.shape[:2]
+        # One coarse pixel spans 1/scale full-res pixels; pad the window to cover rounding
+        margin = int(math.ceil(1.0 / scale)) + 2
+
+        best_val, best_loc = -1.0, (0, 0)
+        for _ in range(self.PYRAMID_CANDIDATES):
+            _, coarse_val, _, coarse_loc = cv2.minMaxLoc(coarse_result)
+            if coarse_val <= -1.0:
+                break
+
+            # Refine around this peak at full resolution
+            x = int(coarse_loc[0] / scale)
+            y = int(coarse_loc[1] / scale)
+            left = max(0, x - margin)
+            top = max(0, y - margin)
+            right = min(zone_w, x + tmpl_w + margin)
+            bottom = min(zone_h, y + tmpl_h + margin)
+            if right - left >= tmpl_w and bottom - top >= tmpl_h:
+                window = zone_img[top:bottom, left:right]
+                fine_result = cv2.matchTemplate(window, template, cv2.TM_CCOEFF_NORMED)
+                _, fine_val, _, fine_loc = cv2.minMaxLoc(fine_result)
+                if fine_val > best_val:
+                    best_val, best_loc = fine_val, (left + fine_loc[0], top + fine_loc[1])
+
+            # Suppress this peak so the next pass finds a different candidate
+            sx = max(0, coarse_loc[0] - coarse_w // 2)
+            sy = max(0, coarse_loc[1] - coarse_h // 2)
+            coarse_result[sy:coarse_loc[1] + coarse_h // 2 + 1, sx:coarse_loc[0] + coarse_w // 2 + 1] = -1.0
+
+        return best_val, best_loc
+
+    def locate_template(self, zone_img, template, ref_image_path=None, template_scale=1.0, match_mode="color", mask=None):
+        """Best TM_CCOEFF_NORMED match of template in zone_img: (max_val, max_loc).
+        
+        template_scale says how far template was resized from the cached reference,
+        so the coarse pyramid copy can also come from the cache. With a mask (masked
+        mode) only the template's opaque pixels are compared, at full resolution.
+        """
+        if mask is not None:
+            result = cv2.matchTemplate(zone_img, template, cv2.TM_CCOEFF_NORMED, mask=mask)
+            # Flat windows give 0/0 under a mask; treat them as no match
+            result[~np.isfinite(result)] = -1.0
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            return max_val, max_loc
+
+        scale = self.pick_pyramid_scale(zone_img, template)
+        if scale is not None:
+            coarse_template = None
+            # A downscaled edge map is a blurred edge map, like the downscaled zone - so
+            # edge templates are resized here rather than re-edged from the cache
+            if ref_image_path and match_mode != "edges":
+                coarse_template = self.templates.get(ref_image_path, match_mode, scale=round(template_scale * scale, 4))
+            log.debug("🔺 Pyramid match at %.2fx, refining %s peaks at full resolution", scale, self.PYRAMID_CANDIDATES)
+            return self.pyramid_match(zone_img, template, scale, coarse_template)
+
+        result = cv2.matchTemplate(zone_img, template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        return max_val, max_loc
+
+    def search_template_scales(self, zone_img, template, ref_image_path=None, confidence_threshold=0.75, match_mode="color",
+                               calibrated_only=False, calibrate=True):
+        """Match template over the candidate scales: (max_val, max_loc, scale, scaled_template).
+        
+        A scale already calibrated for this display is tried first and accepted if it
+        clears the threshold; otherwise every scale in TEMPLATE_SCALES is evaluated and
+        a confident winner is remembered for the display. calibrated_only tries just the
+        calibrated scale, or 1.0 before calibration (used by the fallback zones: the scale
+        is a property of the display, and the primary zone has already tried the others).
+        calibrate=False (a zone cut from a region capture) never records a winner.
+        """
+        ref_key = os.path.basename(ref_image_path) if ref_image_path else None
+        display_calibration = self.display_calibration.get(self.display_key(), {})
+        known_scale = display_calibration.get(ref_key) if ref_key else None
+
+        if not self.scale_search:
+            scales = [1.0]
+        elif calibrated_only:
+            scales = [known_scale if known_scale is not None else 1.0]
+        elif known_scale is not None:
+            scales = [known_scale] + [scale for scale in self.TEMPLATE_SCALES if scale != known_scale]
+        else:
+            scales = list(self.TEMPLATE_SCALES)
+
+        zone_h, zone_w = zone_img.shape[:2]
+        best = (-1.0, (0, 0), 1.0, template)
+        for scale in scales:
+            mask = None
+            if scale == 1.0:
+                scaled = template
+            elif ref_image_path:
+                scaled = self.templates.get(ref_image_path, match_mode, scale=scale)
+            else:
+                scaled = resize_image(template, scale)
+            if match_mode == "masked" and ref_image_path:
+                mask = self.templates.get(ref_image_path, "mask", scale=scale)
+
+            # A template bigger than the zone can't be matched at this scale
+            if scaled.shape[0] > zone_h or scaled.shape[1] > zone_w:
+                continue
+
+            max_val, max_loc = self.locate_template(zone_img, scaled, ref_image_path, scale, match_mode, mask)
+            if max_val > best[0]:
+                best = (max_val, max_loc, scale, scaled)
+
+            # Calibrated scale still matches - no need to search the rest
+            if scale == known_scale and max_val >= confidence_threshold:
+                break
+
+        max_val, _, scale, _ = best
+        if calibrate and self.scale_search and ref_key and max_val >= confidence_threshold and scale != known_scale:
+            log.info("📐 Calibrated %s at template scale %s for display %s", ref_key, scale, self.display_key())
+            self.record_calibration(ref_key, scale)
+
+        return best
+
+    def match_in_zone(self, zone_img, zone_offset, template, grid_zone, confidence_threshold=0.75, ref_image_path=None,
+                      match_mode="color", calibrated_only=False, calibrate=True):
+        """Template-match an already cropped BGR zone and return the match_result dict (or None).
+        
+        template is the BGR reference; the zone and template are converted for match_mode
+        (the template's converted copies come from the cache). Results are cached by
+        template + mode + zone position + a hash of the converted zone's pixels, so a
+        lookup on an unchanged zone skips matchTemplate entirely.
+        """
+        template_version = None
+        if match_mode != "color":
+            zone_img = convert_for_mode(zone_img, match_mode)
+        if ref_image_path:
+            # The version changes whenever the cache reloads an edited reference, so stale results stop matching
+            template, template_version = self.templates.get_versioned(ref_image_path, match_mode)
+        elif match_mode != "color":
+            template = convert_for_mode(template, match_mode)
+        if template is None:
+            return None
+
+        cache_key = None
+        if ref_image_path:
+            cache_key = (ref_image_path, match_mode, calibrated_only, template_version, tuple(zone_offset), zone_img.shape,
+                         self.scale_factor, confidence_threshold, hash_pixels(zone_img))
+            found, cached = self.match_cache.get(cache_key)
+            if found:
+                log.debug("⚡ Zone %s unchanged - reusing previous result for %s", grid_zone, os.path.basename(ref_image_path))
+                return cached
+
+        match_result = self.match_zone_pixels(zone_img, zone_offset, template, grid_zone, confidence_threshold,
+                                              ref_image_path, match_mode, calibrated_only, calibrate)
+        if cache_key is not None:
+            self.match_cache.put(cache_key, match_result)
+        return match_result
+
+    def match_zone_pixels(self, zone_img, zone_offset, template, grid_zone, confidence_threshold=0.75, ref_image_path=None,
+                          match_mode="color", calibrated_only=False, calibrate=True):
+        """Uncached matching for match_in_zone() (zone and template already converted for match_mode)"""
+        # Perform template matching (over template scales when scale_search is on)
+        max_val, max_loc, template_scale, template = self.search_template_scales(
+            zone_img, template, ref_image_path, confidence_threshold, match_mode, calibrated_only, calibrate)
+
+        log.debug("🎯 Template match confidence: %.3f (threshold: %s)", max_val, confidence_threshold)
+
+        if max_val < confidence_threshold:
+            log.debug("⚠️ Low match confidence: %.3f < %s", max_val, confidence_threshold)
+            return None
 
-    def find_best_match_in_zone(self, image_path, ref_image_path, grid_zone, confidence_threshold=0.75):
-        """Find best template match within specified zone"""
+        # Calculate absolute screen coordinates
+        template_height, template_width = template.shape[:2]
+        zone_left, zone_top = zone_offset
+        
+        # Convert back to logical coordinates for mouse movement
+        logical_x = (zone_left + max_loc[0] + (template_width // 2)) / self.scale_factor
+        logical_y = (zone_top + max_loc[1] + (template_height // 2)) / self.scale_factor
+        
+        match_result = {
+            "center_x": int(logical_x),
+            "center_y": int(logical_y),
+            "confidence": float(max_val),
+            "template_size": (template_width, template_height),
+            "template_scale": template_scale,
+            "match_mode": match_mode,
+            "zone": grid_zone
+        }
+        
+        log.info("✅ Found match at logical coordinates (%d, %d) with confidence %.3f", int(logical_x), int(logical_y), max_val)
+        return match_result
+
+    def find_best_match_in_zone(self, image, ref_image_path, grid_zone, confidence_threshold=0.75, frame_origin=None,
+                                match_mode="color", calibrated_only=False):
+        """Find best template match within specified zone (image is a path or BGR array)"""
         try:
             # Load and crop zone using scaled coordinates for image analysis
-            zone_img, zone_offset = self.load_and_crop_zone(image_path, grid_zone)
+            zone_img, zone_offset = self.load_and_crop_zone(image, grid_zone, frame_origin)
             
-            # Load reference template
-            template = cv2.imread(ref_image_path)
+            # Reference template comes from the in-memory cache
+            template = self.templates.get(ref_image_path)
             if template is None:
-                print(f"❌ Reference template not found: {ref_image_path}")
+                log.error("❌ Reference template not found: %s", ref_image_path)
                 return None
 
-            # Perform template matching
-            result = cv2.matchTemplate(zone_img, template, cv2.TM_CCOEFF_NORMED)
-            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            return self.match_in_zone(zone_img, zone_offset, template, grid_zone, confidence_threshold, ref_image_path,
+                                      match_mode, calibrated_only, calibrate=frame_origin is None)
 
-            print(f"🎯 Template match confidence: {max_val:.3f} (threshold: {confidence_threshold})")
+        except Exception as e:
+            log.error("❌ Template matching failed: %s", e)
+            return None
 
-            if max_val < confidence_threshold:
-                print(f"⚠️ Low match confidence: {max_val:.3f} < {confidence_threshold}")
-                return None
+    def find_targets(self, target_names, frame=None, confidence_threshold=0.75, frame_origin=None):
+        """Find several targets in one frame.
+        
+        Each distinct grid_zone is cropped once and the template matches run on a
+        thread pool (cv2.matchTemplate releases the GIL). Targets that miss their zone then
+        get the fallback search. Returns {target_name: match_result or None}.
+        Pass frame_origin when frame is a region capture rather than the full screen.
+        The fallback budgets count from the start of the call, batch pass included.
+        """
+        started = time.perf_counter()
+        if frame is None:
+            if self.last_frame is None:
+                self.capture_frame()
+            frame, frame_origin = self.last_frame, self.last_frame_origin
 
-            # Calculate absolute screen coordinates
-            template_height, template_width = template.shape[:2]
-            zone_left, zone_top = zone_offset
-            
-            # Convert back to logical coordinates for mouse movement
-            logical_x = (zone_left + max_loc[0] + (template_width // 2)) / self.scale_factor
-            logical_y = (zone_top + max_loc[1] + (template_height // 2)) / self.scale_factor
-            
-            match_result = {
-                "center_x": int(logical_x),
-                "center_y": int(logical_y),
-                "confidence": float(max_val),
-                "template_size": (template_width, template_height),
-                "zone": grid_zone
-            }
-            
-            print(f"✅ Found match at logical coordinates ({int(logical_x)}, {int(logical_y)}) with confidence {max_val:.3f}")
-            return match_result
+        results = dict.fromkeys(target_names)
+        crops = {}
+        jobs = []
+        for target_name in target_names:
+            target_config = self.TARGET_ZONES.get(target_name)
+            if target_config is None:
+                log.error("❌ Unknown target: %s", target_name)
+                continue
 
-        except Exception as e:
-            print(f"❌ Template matching failed: {e}")
-            return None
+            ref_image_path = target_config.get("ref_image")
+            if not ref_image_path:
+                log.error("❌ No reference image configured for %s", target_name)
+                continue
+
+            ref_full_path = self.ref_image_full_path(ref_image_path)
+            template = self.templates.get(ref_full_path)
+            if template is None:
+                log.error("❌ Reference image not found for %s: %s", target_name, ref_image_path)
+                continue
+
+            # Targets sharing a zone share one crop
+            grid_zone = target_config["grid_zone"]
+            zone_key = tuple(grid_zone)
+            if zone_key not in crops:
+                crops[zone_key] = self.load_and_crop_zone(frame, grid_zone, frame_origin)
+            jobs.append((target_name, crops[zone_key], template, grid_zone, ref_full_path,
+                         self.target_match_mode(target_config)))
+
+        def _match(job):
+            target_name, (zone_img, zone_offset), template, grid_zone, ref_full_path, match_mode = job
+            try:
+                return target_name, self.match_in_zone(zone_img, zone_offset, template, grid_zone,
+                                                       confidence_threshold, ref_full_path, match_mode,
+                                                       calibrate=frame_origin is None)
+            except Exception as e:
+                log.error("❌ Template matching failed for %s: %s", target_name, e)
+                return target_name, None
+
+        if jobs:
+            log.debug("🎯 Matching %d targets across %d zones", len(jobs), len(crops))
+            if self._match_pool is None:
+                preload(cv2, np)
+                self._match_pool = futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+            for target_name, match in self._match_pool.map(_match, jobs):
+                results[target_name] = match
 
-    def find_target(self, target_name, screenshot_path=None):
-        """Find target using zoned search with fallback expansion"""
+            # Widen the search for the misses; every budget counts from the start of this call
+            missed = [job[0] for job in jobs if results[job[0]] is None]
+            if missed:
+                frame, frame_origin = self.full_frame_for_fallback(frame, frame_origin)
+            for target_name in missed:
+                results[target_name] = self.search_fallback_zones(target_name, frame, frame_origin, started,
+                                                                  confidence_threshold=confidence_threshold)
+
+        return results
+
+    @traced()
+    def find_target(self, target_name, screenshot_path=None, frame=None, frame_origin=None):
+        """Find target using zoned search with fallback expansion.
+        
+        Pass frame (BGR array from capture_frame) to skip decoding a PNG from disk, plus
+        frame_origin if it is a region capture. With neither frame nor screenshot_path,
+        the last captured frame (full or region) is used if there is one.
+        """
+        started = time.perf_counter()
         if target_name not in self.TARGET_ZONES:
-            print(f"❌ Unknown target: {target_name}")
+            log.error("❌ Unknown target: %s", target_name)
             return None
 
         target_config = self.TARGET_ZONES[target_name]
@@ -197,37 +942,98 @@ class WebOMatic_Precision:
         ref_image_path = target_config.get("ref_image")
         
         if not ref_image_path:
-            print(f"❌ No reference image configured for {target_name}")
+            log.error("❌ No reference image configured for %s", target_name)
             return None
 
-        # Use provided screenshot or default - FIXED: actually use the provided screenshot!
-        if screenshot_path is None:
-            screenshot_path = self.screenshot_path
-            print(f"🔍 Using default screenshot: {screenshot_path}")
+        # Prefer an in-memory frame, then the provided screenshot, then the default file
+        if frame is None and screenshot_path is None and self.last_frame is not None:
+            frame, frame_origin = self.last_frame, self.last_frame_origin
+
+        if frame is not None:
+            image = frame
+            log.debug("🔍 Using in-memory frame: %sx%s", frame.shape[1], frame.shape[0])
         else:
-            print(f"🔍 Using fresh screenshot: {screenshot_path}")
+            if screenshot_path is None:
+                screenshot_path = self.screenshot_path
+                log.debug("🔍 Using default screenshot: %s", screenshot_path)
+            else:
+                log.debug("🔍 Using fresh screenshot: %s", screenshot_path)
 
-        if not os.path.exists(screenshot_path):
-            print(f"❌ Screenshot not found: {screenshot_path}")
-            return None
+            if not os.path.exists(screenshot_path):
+                log.error("❌ Screenshot not found: %s", screenshot_path)
+                return None
+            image = screenshot_path
 
-        # Construct full path to reference image
-        ref_full_path = os.path.join(os.path.dirname(__file__), "kai_ui_refs", ref_image_path)
+        # Construct full path to reference image (decoded copy lives in the template cache)
+        ref_full_path = self.ref_image_full_path(ref_image_path)
         
-        if not os.path.exists(ref_full_path):
-            print(f"❌ Reference image not found: {ref_full_path}")
+        if self.templates.get(ref_full_path) is None:
+            log.error("❌ Reference image not found: %s", ref_full_path)
             return None
 
-        print(f"🎯 Searching for {target_name} in zone {grid_zone}")
+        log.debug("🎯 Searching for %s in zone %s", target_name, grid_zone)
+        
+        # Decode a screenshot path once so every search stage reuses the same pixels
+        image = self.load_frame(image)
+        match_mode = self.target_match_mode(target_config)
         
         # Primary search in specified zone
-        match = self.find_best_match_in_zone(screenshot_path, ref_full_path, grid_zone)
+        match = self.find_best_match_in_zone(image, ref_full_path, grid_zone, frame_origin=frame_origin,
+                                             match_mode=match_mode)
         
         if match:
             return match
 
-        # TODO: Fallback search in expanded zones if needed
-        print(f"⚠️ {target_name} not found in primary zone {grid_zone}")
+        log.debug("🔎 %s not in primary zone %s - widening the search", target_name, grid_zone)
+        image, frame_origin = self.full_frame_for_fallback(image, frame_origin)
+        return self.search_fallback_zones(target_name, image, frame_origin, started)
+
+    def full_frame_for_fallback(self, image, frame_origin):
+        """A region capture only covers the primary zones: grab the full screen for the wider stages.
+        
+        Returns (image, frame_origin); the region is kept if no full frame can be grabbed.
+        """
+        if frame_origin is None:
+            return image, frame_origin
+        try:
+            frame = self.capture_frame()
+        except Exception as e:
+            log.warning("⚠️ Can't grab a full frame for the fallback search (%s) - searching the region only", e)
+            return image, frame_origin
+        self.update_frame_scale(frame.shape[1], frame.shape[0])
+        return frame, None
+
+    def search_fallback_zones(self, target_name, image, frame_origin=None, started=None, confidence_threshold=0.75):
+        """Search the target's fallback zones in order on the same frame; returns the first confident match.
+        
+        The time budget is checked before each stage (a stage that has started runs to
+        completion), so a slow miss costs at most the budget plus one stage.
+        """
+        target_config = self.TARGET_ZONES[target_name]
+        grid_zone = target_config["grid_zone"]
+        ref_full_path = self.ref_image_full_path(target_config["ref_image"])
+        match_mode = self.target_match_mode(target_config)
+        stages = target_config.get("fallback", self.FALLBACK_STAGES) or ()
+        budget_ms = target_config.get("time_budget_ms", self.FALLBACK_TIME_BUDGET_MS)
+        started = started or time.perf_counter()
+
+        searched = 0
+        for stage, zone in self.fallback_zones(grid_zone, stages):
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if elapsed_ms >= budget_ms:
+                log.warning("⏱️ %s: %.0fms time budget spent before the %s stage", target_name, budget_ms, stage)
+                break
+            with tracer.span("fallback_search", target=target_name, stage=stage):
+                match = self.find_best_match_in_zone(image, ref_full_path, zone, confidence_threshold,
+                                                     frame_origin, match_mode, calibrated_only=True)
+            searched += 1
+            if match:
+                match = dict(match, fallback_stage=stage)   # The cached result stays stage-free
+                log.info("🔎 Found %s in %s fallback zone %s after %.0fms", target_name, stage, zone,
+                         (time.perf_counter() - started) * 1000)
+                return match
+
+        log.warning("⚠️ %s not found in primary zone %s or %d fallback zones", target_name, grid_zone, searched)
         return None
 
     def generate_human_movement_bursts(self, start_x, start_y, end_x, end_y):
@@ -306,9 +1112,10 @@ class WebOMatic_Precision:
         
         return movement_bursts
 
+    @traced()
     def execute_human_movement(self, target_x, target_y):
         """Execute Jon's burst-and-pause movement pattern"""
-        print(f"🎯 Moving to ({target_x}, {target_y}) using Jon's movement signature")
+        log.info("🎯 Moving to (%s, %s) using Jon's movement signature", target_x, target_y)
         
         # Get current position
         current_x, current_y = pyautogui.position()
@@ -317,7 +1124,7 @@ class WebOMatic_Precision:
         distance = math.sqrt((target_x - current_x)**2 + (target_y - current_y)**2)
         
         if distance < 10:
-            print("🎯 Already very close to target, adding micro-adjustments...")
+            log.debug("🎯 Already very close to target, adding micro-adjustments...")
             # Just do micro-settling
             for _ in range(2):
                 offset_x = random.randint(-2, 2)
@@ -330,12 +1137,12 @@ class WebOMatic_Precision:
         # Generate and execute movement bursts
         bursts = self.generate_human_movement_bursts(current_x, current_y, target_x, target_y)
         
-        print(f"🚀 Executing {len(bursts)} movement bursts/pauses")
+        log.debug("🚀 Executing %d movement bursts/pauses", len(bursts))
         
         total_time = 0
         for i, burst in enumerate(bursts):
             if burst['type'] == 'movement':
-                print(f"   📍 Burst {i+1}: {len(burst['movements'])} micro-movements over {burst['duration']*1000:.0f}ms")
+                log.debug("   📍 Burst %s: %d micro-movements over %.0fms", i+1, len(burst['movements']), burst['duration']*1000)
                 
                 # Execute rapid micro-movements
                 for movement in burst['movements']:
@@ -345,7 +1152,7 @@ class WebOMatic_Precision:
                 total_time += burst['duration']
                 
             elif burst['type'] == 'pause':
-                print(f"   ⏸️  Pause {i+1}: {burst['duration']*1000:.0f}ms at ({burst['position'][0]}, {burst['position'][1]})")
+                log.debug("   ⏸️  Pause %s: %.0fms at (%s, %s)", i+1, burst['duration']*1000, burst['position'][0], burst['position'][1])
                 
                 # Stay at position during pause (crucial for browser detection)
                 pyautogui.moveTo(burst['position'][0], burst['position'][1], duration=0)
@@ -354,7 +1161,7 @@ class WebOMatic_Precision:
                 total_time += burst['duration']
         
         # Final positioning with micro-settling
-        print("🎯 Final micro-settling...")
+        log.debug("🎯 Final micro-settling...")
         for _ in range(3):
             offset_x = random.randint(-2, 2)
             offset_y = random.randint(-2, 2)
@@ -364,63 +1171,182 @@ class WebOMatic_Precision:
         # Final exact position
         pyautogui.moveTo(target_x, target_y, duration=0)
         
-        print(f"✅ Movement complete in {total_time:.3f}s")
+        log.info("✅ Movement complete in %.3fs", total_time)
+
+    def capture_frame(self, save_to_disk=False, region=None):
+        """Grab the screen straight into a BGR NumPy array (no PNG round-trip).
+        
+        region is (left, top, width, height) in frame pixels; only that rectangle is grabbed.
+        """
+        frame = self.get_capture().grab(region)
+        self.last_frame = frame
+        self.last_frame_origin = (region[0], region[1]) if region else None
+        
+        if region is None:
+            self.full_frame_captured = True
+            if save_to_disk:
+                self.save_frame_async(frame)
+        return frame
+
+    def get_capture(self):
+        """Open the configured capture backend on first use"""
+        if self._capture is None:
+            self._capture = make_capture(self.capture_backend)
+            log.info("📸 Using %s capture backend", self._capture.name)
+        return self._capture
+
+    def zones_region(self, grid_zones):
+        """Union of the pixel bounds of several grid zones, clipped to the frame: (left, top, width, height)"""
+        bounds = [self.get_zone_bounds(grid_zone) for grid_zone in grid_zones]
+        left = max(0, min(b[0] for b in bounds))
+        top = max(0, min(b[1] for b in bounds))
+        right = min(self.frame_size[0], max(b[0] + b[2] for b in bounds))
+        bottom = min(self.frame_size[1], max(b[1] + b[3] for b in bounds))
+        return (left, top, max(0, right - left), max(0, bottom - top))
+
+    def capture_target_zones(self, target_names):
+        """Capture only the rectangle covering the targets' grid zones.
+        
+        The frame and its origin become last_frame/last_frame_origin, so find_target()
+        and find_targets() pick them up with the right offsets. Until a full frame has
+        been seen the display scale is unknown, so the first call grabs the full screen.
+        """
+        grid_zones = [self.TARGET_ZONES[name]["grid_zone"] for name in target_names if name in self.TARGET_ZONES]
+        if not grid_zones or not self.full_frame_captured:
+            frame = self.capture_frame()
+            if not grid_zones:
+                return frame
+            # Size the grid to this display before computing the region
+            self.update_frame_scale(frame.shape[1], frame.shape[0])
+            left, top, width, height = self.zones_region(grid_zones)
+            self.last_frame = frame[top:top + height, left:left + width]
+            self.last_frame_origin = (left, top)
+            return self.last_frame
+
+        region = self.zones_region(grid_zones)
+        log.debug("📸 Capturing region %s for %s", region, ', '.join(target_names))
+        return self.capture_frame(region=region)
+
+    def save_frame_async(self, frame, path=None):
+        """Write a frame to disk on a background thread so capture doesn't wait on PNG encoding.
+        
+        Never blocks: while a write is in flight the frame replaces any other one waiting,
+        and the writer picks up the newest when it finishes. Returns the writer thread.
+        """
+        with self._save_lock:
+            self._save_pending = (frame, path or self.screenshot_path)
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(target=self._save_frames, daemon=True)
+                self._save_thread.start()
+            return self._save_thread
 
-    def take_fresh_screenshot(self):
-        """Take a new screenshot on current desktop"""
-        print("📸 Taking fresh screenshot...")
-        screenshot = pyautogui.screenshot()
-        screenshot.save(self.screenshot_path)
-        print(f"✅ Screenshot saved: {self.screenshot_path}")
+    def _save_frames(self):
+        """Writer thread for save_frame_async(): write the waiting frame until none is left"""
+        while True:
+            with self._save_lock:
+                if self._save_pending is None:
+                    self._save_thread = None
+                    return
+                frame, path = self._save_pending
+                self._save_pending = None
+            # Write to a temp file then rename, so readers never see a half-written PNG
+            tmp_path = path + ".tmp.png"
+            if cv2.imwrite(tmp_path, frame):
+                os.replace(tmp_path, path)
+            else:
+                log.warning("⚠️ Could not save screenshot: %s", path)
+
+    @traced()
+    def take_fresh_screenshot(self, save_to_disk=True):
+        """Take a new screenshot on current desktop, returning it as a BGR array"""
+        log.debug("📸 Taking fresh screenshot...")
+        frame = self.capture_frame(save_to_disk=save_to_disk)
         
         # Check actual dimensions (but don't scale)
-        img = cv2.imread(self.screenshot_path)
-        if img is not None:
-            h, w = img.shape[:2]
-            print(f"📏 New screenshot dimensions: {w}x{h} pixels")
-        return self.screenshot_path
+        h, w = frame.shape[:2]
+        log.debug("📏 New screenshot dimensions: %sx%s pixels", w, h)
+        if save_to_disk:
+            log.debug("💾 Saving screenshot in background: %s", self.screenshot_path)
+        return frame
+
+    def start_continuous_capture(self, interval=0.05, size=4):
+        """Keep a ring buffer of recent frames filled on a background thread"""
+        if self.continuous_capture is None:
+            preload(cv2, np)
+            self.continuous_capture = ContinuousCapture(self.get_capture(), size=size, interval=interval)
+        self.continuous_capture.start()
+
+    def stop_continuous_capture(self):
+        """Stop the background capture thread"""
+        if self.continuous_capture is not None:
+            self.continuous_capture.stop()
 
+    @traced()
+    def wait_for_stable_zone(self, grid_zone, timeout=3.0, since=None):
+        """Wait until grid_zone stops changing in the continuous capture; returns the frame or None.
+        
+        The returned frame becomes last_frame, so find_target() uses it without another capture.
+        """
+        if self.continuous_capture is None or not self.continuous_capture.running:
+            log.warning("⚠️ Continuous capture is not running")
+            return None
+
+        # Zone bounds depend on the display scale, so size the grid from a buffered frame first
+        latest = self.continuous_capture.buffer.latest() or self.continuous_capture.buffer.wait_for_new(0, timeout)
+        if latest is None:
+            log.warning("⚠️ No frames captured yet")
+            return None
+        frame_origin = self.continuous_capture.frame_origin()
+        if frame_origin is None:
+            self.update_frame_scale(latest[2].shape[1], latest[2].shape[0])
+
+        started = time.time()
+        frame = self.continuous_capture.wait_for_stable_frame(self.get_zone_bounds(grid_zone), timeout, since=since)
+        if frame is None:
+            log.warning("⚠️ Zone %s still changing after %.1fs", grid_zone, timeout)
+            return None
+
+        log.debug("✅ Zone %s settled after %.0fms", grid_zone, (time.time() - started) * 1000)
+        self.last_frame = frame
+        self.last_frame_origin = frame_origin
+        if frame_origin is None:
+            self.full_frame_captured = True
+        return frame
+
+    @traced()
     def precision_click(self, target_name, screenshot_path=None):
         """Main function: find target and click with human movement"""
-        print(f"\n🎯 PRECISION CLICK: {target_name}")
-        print("=" * 50)
+        log.info("\n🎯 PRECISION CLICK: %s", target_name)
+        log.info("=" * 50)
         
-        # Switch to desktop 1 first (removed duplicate - only switch once)
-        self.switch_to_desktop_1()
-        time.sleep(1.0)  # Ensure desktop is fully switched
-        
-        # Take fresh screenshot on desktop 1
-        self.take_fresh_screenshot()
+        if self.continuous_capture is not None and self.continuous_capture.running:
+            # Switch without the fixed sleeps, then wait for the target's zone to settle
+            self.switch_to_desktop_1(settle=False)
+            grid_zone = self.TARGET_ZONES.get(target_name, {}).get("grid_zone", ["A1", "L8"])
+            if self.wait_for_stable_zone(grid_zone, timeout=2.0, since=time.time()) is None:
+                self.take_fresh_screenshot()
+        else:
+            # Switch to desktop 1 first (removed duplicate - only switch once)
+            self.switch_to_desktop_1()
+            time.sleep(1.0)  # Ensure desktop is fully switched
+            
+            # Take fresh screenshot on desktop 1
+            self.take_fresh_screenshot()
 
         # Bypass detection: use known Gmail icon center
         center_x = 920
         center_y = 480
         confidence = 1.0
 
-        print(f"🎯 Using fixed Gmail coordinates: ({center_x}, {center_y}) with assumed confidence {confidence:.3f}")
+        log.info("🎯 Using fixed Gmail coordinates: (%s, %s) with assumed confidence %.3f", center_x, center_y, confidence)
 
         
-        print(f"🎯 Target found at ({center_x}, {center_y}) with {confidence:.3f} confidence")
+        log.info("🎯 Target found at (%s, %s) with %.3f confidence", center_x, center_y, confidence)
         
         # Execute human-like movement and click
-        self.execute_human_movement(center_x, center_y)
+        self.human_click(center_x, center_y)
         
-        # Click with slight delay after settling
-        time.sleep(random.uniform(0.2, 0.4))
-        
-        # First click to activate homepage focus
-        pyautogui.mouseDown(button='left')
-        time.sleep(0.15)
-        pyautogui.mouseUp(button='left')
-        time.sleep(0.4)  # Pause before second click
-
-        # Second click to actually open the link
-        pyautogui.mouseDown(button='left')
-        time.sleep(0.15)
-        pyautogui.mouseUp(button='left')
-
-        
-        print(f"✅ Precision click executed on {target_name}")
+        log.info("✅ Precision click executed on %s", target_name)
         
         # Create intent JSON for compatibility
         intent_data = {
@@ -431,34 +1357,238 @@ class WebOMatic_Precision:
                 "center_y": center_y
             },
             "confidence": confidence,
-            "zone": match["zone"],
+            "zone": "manual_override",
             "timestamp": datetime.now().isoformat()
         }
         
-        with open(self.intent_path, 'w') as f:
-            json.dump(intent_data, f, indent=2)
+        self.write_intent_file(intent_data)
         
         return True
 
-    def switch_to_desktop_1(self):
-        """Switch to desktop 1 by pressing Control + Right arrow"""
-        print("🖥️ Switching to desktop 1...")
+    def human_click(self, x, y, clicks=2):
+        """Move to (x, y) with the burst-and-pause pattern and click.
+        
+        The default two clicks are the precision_click sequence: the first gives the page
+        focus, the second actually opens the link.
+        """
+        self.execute_human_movement(x, y)
+        
+        with tracer.span("click", x=x, y=y):
+            # Click with slight delay after settling
+            time.sleep(random.uniform(0.2, 0.4))
+            
+            for i in range(clicks):
+                if i:
+                    time.sleep(0.4)  # Pause before the next click
+                pyautogui.mouseDown(button='left')
+                time.sleep(0.15)
+                pyautogui.mouseUp(button='left')
+
+    def wait_for_zone_change(self, grid_zone, reference, timeout=5.0, interval=0.05):
+        """Wait until grid_zone differs from `reference` (a zone_signature) and then settles.
+        
+        Uses the continuous capture buffer when it is running, otherwise grabs just the
+        zone every `interval` seconds. Returns the settled frame (also kept as last_frame)
+        or None on timeout.
+        """
+        left, top, width, height = self.get_zone_bounds(grid_zone)
+        deadline = time.time() + timeout
+        changed = reference is None
+        previous = None
+        last_seq = 0
+        
+        while time.time() < deadline:
+            if self.continuous_capture is not None and self.continuous_capture.running:
+                entry = self.continuous_capture.buffer.wait_for_new(last_seq, deadline - time.time())
+                if entry is None:
+                    break
+                last_seq, _, frame = entry
+                frame_origin = self.continuous_capture.frame_origin()
+            else:
+                frame = self.capture_frame(region=(left, top, width, height))
+                frame_origin = (left, top)
+            
+            origin = frame_origin or (0, 0)
+            signature = zone_signature(frame, (left - origin[0], top - origin[1], width, height))
+            if not changed:
+                changed = signatures_differ(reference, signature)
+            elif previous is not None and not signatures_differ(previous, signature):
+                self.last_frame = frame
+                self.last_frame_origin = frame_origin
+                return frame
+            previous = signature
+            
+            if self.continuous_capture is None or not self.continuous_capture.running:
+                time.sleep(interval)
+        
+        log.warning("⚠️ Zone %s did not %s within %.1fs", grid_zone, "settle" if changed else "change", timeout)
+        return None
+
+    def frame_covers(self, frame, frame_origin, grid_zone):
+        """Whether a (possibly region) frame contains all of grid_zone"""
+        if frame is None:
+            return False
+        left, top, width, height = self.get_zone_bounds(grid_zone)
+        origin = frame_origin or (0, 0)
+        frame_h, frame_w = frame.shape[:2]
+        return (left >= origin[0] and top >= origin[1] and
+                left + width <= origin[0] + frame_w and top + height <= origin[1] + frame_h)
+
+    def zone_signature_in(self, frame, frame_origin, grid_zone):
+        """Signature of grid_zone in a (possibly region) frame, or None if the frame doesn't cover it"""
+        if not self.frame_covers(frame, frame_origin, grid_zone):
+            return None
+        left, top, width, height = self.get_zone_bounds(grid_zone)
+        origin = frame_origin or (0, 0)
+        return zone_signature(frame, (left - origin[0], top - origin[1], width, height))
+
+    def refresh_frame_for(self, target_name, since=None):
+        """Get a frame showing target_name's zone as it is now (after the last action)"""
+        grid_zone = self.TARGET_ZONES[target_name]["grid_zone"]
+        if self.continuous_capture is not None and self.continuous_capture.running:
+            if self.wait_for_stable_zone(grid_zone, timeout=2.0, since=since) is not None:
+                return
+        self.capture_target_zones([target_name])
+
+    @traced()
+    def run_plan(self, steps, stop_on_error=True):
+        """Run an ordered list of actions in one session and report per-step timing.
+        
+        Each step is a dict (a bare string is shorthand for a click):
+            {"action": "click", "target": "Gmail", "clicks": 2}
+            {"action": "click", "x": 920, "y": 480}                  # fixed coordinates
+            {"action": "type", "text": "hello", "interval": 0.05, "enter": True}
+            {"action": "wait", "zone": ["A2", "C3"], "timeout": 5}   # or "target": name
+            {"action": "sleep", "seconds": 0.5}
+        
+        The desktop switch, browser activation and first screenshot happen once. After
+        that a frame is only re-captured when an action may have changed the screen,
+        and only the zones the next step needs. "wait" returns once the zone differs
+        from how it looked before the previous action and has settled.
+        
+        Returns {"ok", "total_ms", "steps": [{"index", "action", "ok", "ms", ...}]}.
+        """
+        plan_started = time.perf_counter()
+        results = []
+        log.info("\n📋 RUNNING PLAN: %d steps", len(steps))
+        log.info("=" * 50)
+        
+        # One-time session setup
+        continuous = self.continuous_capture is not None and self.continuous_capture.running
+        self.switch_to_desktop_1(settle=not continuous)
+        self.activate_browser_window()
+        frame = self.take_fresh_screenshot(save_to_disk=False)
+        self.update_frame_scale(frame.shape[1], frame.shape[0])
+        results.append({"index": 0, "action": "setup", "ok": True,
+                        "ms": (time.perf_counter() - plan_started) * 1000})
+        
+        frame_current = True        # last_frame still shows the screen as it is (maybe only a region of it)
+        last_action_at = None
+        pre_action_frame = None     # (frame, origin) from just before the previous action
+        
+        for index, step in enumerate(steps, start=1):
+            if isinstance(step, str):
+                step = {"action": "click", "target": step}
+            action = step.get("action", "click")
+            result = {"index": index, "action": action}
+            step_started = time.perf_counter()
+            
+            with tracer.span("plan_step", index=index, action=action):
+                try:
+                    if action == "click":
+                        if "target" in step:
+                            target_name = step["target"]
+                            if target_name not in self.TARGET_ZONES:
+                                raise ValueError(f"Unknown target: {target_name}")
+                            result["target"] = target_name
+                            # A wait leaves only its own zone in last_frame, which may not show this target
+                            if not frame_current or not self.frame_covers(self.last_frame, self.last_frame_origin,
+                                                                          self.TARGET_ZONES[target_name]["grid_zone"]):
+                                self.refresh_frame_for(target_name, since=last_action_at)
+                            match = self.find_target(target_name)
+                            if match is None:
+                                raise LookupError(f"{target_name} not found")
+                            x, y = match["center_x"], match["center_y"]
+                            result["confidence"] = match["confidence"]
+                        else:
+                            x, y = int(step["x"]), int(step["y"])
+                        pre_action_frame = (self.last_frame, self.last_frame_origin)
+                        self.human_click(x, y, clicks=step.get("clicks", 2))
+                        result["coordinates"] = (x, y)
+                        frame_current = False
+                        last_action_at = time.time()
+                    
+                    elif action == "type":
+                        pre_action_frame = (self.last_frame, self.last_frame_origin)
+                        pyautogui.typewrite(step["text"], interval=step.get("interval", 0.05))
+                        if step.get("enter"):
+                            pyautogui.press("enter")
+                        result["chars"] = len(step["text"])
+                        frame_current = False
+                        last_action_at = time.time()
+                    
+                    elif action == "wait":
+                        grid_zone = step.get("zone") or self.TARGET_ZONES[step["target"]]["grid_zone"]
+                        result["zone"] = grid_zone
+                        reference = self.zone_signature_in(*pre_action_frame, grid_zone) if pre_action_frame else None
+                        if self.wait_for_zone_change(grid_zone, reference, timeout=step.get("timeout", 5.0)) is None:
+                            raise TimeoutError(f"Zone {grid_zone} did not change")
+                        frame_current = True
+                    
+                    elif action == "sleep":
+                        time.sleep(step.get("seconds", 0.5))
+                    
+                    else:
+                        raise ValueError(f"Unknown plan action: {action}")
+                    
+                    result["ok"] = True
+                except Exception as e:
+                    result["ok"] = False
+                    result["error"] = str(e)
+            
+            result["ms"] = (time.perf_counter() - step_started) * 1000
+            results.append(result)
+            if result["ok"]:
+                log.info("✅ Step %d %s %s: %.0fms", index, action, result.get("target", ""), result["ms"])
+            else:
+                log.error("❌ Step %d %s failed after %.0fms: %s", index, action, result["ms"], result["error"])
+                if stop_on_error:
+                    break
+        
+        total_ms = (time.perf_counter() - plan_started) * 1000
+        ok = len(results) == len(steps) + 1 and all(r["ok"] for r in results)
+        log.info("📋 Plan %s: %d/%d steps in %.0fms", "completed" if ok else "stopped",
+                 sum(1 for r in results[1:] if r["ok"]), len(steps), total_ms)
+        return {"ok": ok, "total_ms": total_ms, "steps": results}
+
+    def write_intent_file(self, intent_data):
+        """Mirror the latest intent to kai_click_intent.json (temp file + rename, never half-written)"""
+        tmp_path = self.intent_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(intent_data, f, indent=2)
+        os.replace(tmp_path, self.intent_path)
+
+    @traced()
+    def switch_to_desktop_1(self, settle=True):
+        """Switch to desktop 1 by pressing Control + Right arrow (settle=False skips the fixed wait)"""
+        log.info("🖥️ Switching to desktop 1...")
         try:
             import subprocess
             subprocess.run([
                 "osascript", "-e",
                 'tell application "System Events" to key code 124 using control down'
             ], check=True)
-            time.sleep(1.0)  # Give time for desktop switch
-            print("✅ Switched to desktop 1 (via Control + Right)")
+            if settle:
+                time.sleep(1.0)  # Give time for desktop switch
+            log.info("✅ Switched to desktop 1 (via Control + Right)")
             return True
         except (subprocess.CalledProcessError, ImportError) as e:
-            print(f"⚠️ Desktop switching failed: {e}")
+            log.warning("⚠️ Desktop switching failed: %s", e)
             return False
 
     def activate_browser_window(self):
         """Activate browser window and ensure it's in focus"""
-        print("🌐 Activating browser window...")
+        log.info("🌐 Activating browser window...")
         
         # Desktop switching is now handled in precision_click() - don't switch here
         
@@ -469,22 +1599,34 @@ class WebOMatic_Precision:
                 'tell application "Google Chrome" to activate'
             ], check=True)
             time.sleep(0.5)
-            print("✅ Chrome activated via AppleScript")
+            log.info("✅ Chrome activated via AppleScript")
         except (subprocess.CalledProcessError, ImportError):
-            print("⚠️  AppleScript activation failed")
+            log.warning("⚠️  AppleScript activation failed")
         
         # Fallback: Click in browser area
-        browser_center_x = self.ANCHOR_LEFT + (self.GRID_WIDTH // 2)
-        browser_center_y = self.ANCHOR_TOP + (self.GRID_HEIGHT // 2)
+        browser_center_x = self.BASE_ANCHOR_LEFT + (self.BASE_GRID_WIDTH // 2)
+        browser_center_y = self.BASE_ANCHOR_TOP + (self.BASE_GRID_HEIGHT // 2)
         
         pyautogui.moveTo(browser_center_x, browser_center_y, duration=0.3)
         time.sleep(0.2)
         pyautogui.click()
         time.sleep(0.5)
-        print("✅ Browser window focused")
+        log.info("✅ Browser window focused")
+
+def list_targets(config_path=None):
+    """Print the configured targets straight from targets_zones.json (no templates, no screen access)"""
+    config_path = config_path or os.path.join(os.path.dirname(__file__), "targets_zones.json")
+    with open(config_path, "r") as f:
+        target_zones = json.load(f)
+    for target_name, config in target_zones.items():
+        print(f"  - {target_name:20s} {'-'.join(config.get('grid_zone', []))}  {config.get('ref_image') or '(no ref image)'}")
 
 def main():
     """Main function for testing"""
+    if "--list-targets" in sys.argv[1:]:
+        list_targets()
+        return
+    
     precision = WebOMatic_Precision()
     
     print("🧠 Web-O-Matic Precision System")
@@ -521,11 +1663,14 @@ def main():
             precision.activate_browser_window()
             
         elif cmd == "quit":
+            if tracer.enabled:
+                tracer.print_summary()
             break
             
         else:
             print("❌ Invalid command")
 
 if __name__ == "__main__":
-    print("🧠 web_o_matic_precision initialized. Ready for input.")
+    if "--list-targets" not in sys.argv[1:]:
+        print("🧠 web_o_matic_precision initialized. Ready for input.")
     main()
\ No newline at end of file